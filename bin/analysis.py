@@ -0,0 +1,411 @@
+"""
+Schedule analysis helpers.
+
+Works on the same 3d matrix the solver fills (matrix[group][period][day]).
+Schedules are encoded once into an integer array of activity ids so that the
+rule checks can run as whole-array NumPy passes instead of nested loops, and
+many weeks can be checked together by stacking them on a leading axis.
+"""
+
+# Imports:
+# - numpy: encoded schedules and vectorized rule checks
+# - functools: caches statistics so every exporter shares one computation
+import functools
+import numpy as np
+
+
+# id used for an empty cell in an encoded schedule
+EMPTY = -1
+
+# periods before the lunch break in the template (Period 1 and Period 2)
+MORNING_PERIODS = 2
+
+# README rule: no group may have the same activity more than 3 times per week
+DEFAULT_MAX_USES = 3
+
+# rule names used in violation reports, in the order they are reported
+RULES = ("shape", "clash", "weekly_cap", "once_per_day", "day_gap", "part_of_day")
+
+# hard rules are errors, the "should"/"when possible" rules are warnings
+SEVERITY = {
+    "shape": "error",
+    "clash": "error",
+    "weekly_cap": "error",
+    "once_per_day": "error",
+    "day_gap": "warning",
+    "part_of_day": "warning",
+}
+
+
+def encode_schedules(matrices, activities=None):
+    """
+    Encode schedules of the same shape into one integer array.
+
+    :param matrices: list of 3d lists (group, period, day) with equal shapes
+    :param activities: optional list of activity names; ids follow this order
+        and any other names found are appended after it
+    :return: (codes, names) where codes is an int16 array of shape
+        (weeks, groups, periods, days) with EMPTY for blank cells
+    """
+    try:
+        cells = np.asarray(matrices, dtype=str)
+    except ValueError:
+        raise ValueError("Schedules must all have the same number of groups, periods and days")
+    if cells.ndim != 4:
+        raise ValueError(f"Expected a list of group x period x day schedules, got {cells.ndim - 1} dimensions")
+
+    names = list(activities) if activities else []
+    lookup = {name: i for i, name in enumerate(names)}
+    unique, inverse = np.unique(cells, return_inverse=True)
+    ids = np.empty(len(unique), dtype=np.int16)
+    for i, name in enumerate(unique.tolist()):
+        name = name.strip()
+        if not name:
+            ids[i] = EMPTY
+            continue
+        if name not in lookup:
+            lookup[name] = len(names)
+            names.append(name)
+        ids[i] = lookup[name]
+
+    codes = ids[inverse.reshape(-1)].reshape(cells.shape)
+    return codes, names
+
+
+def encode_schedule(matrix, activities=None):
+    """
+    Encode a single schedule.
+
+    :param matrix: 3d list
+    :param activities: optional list of activity names
+    :return: (codes, names) with codes of shape (groups, periods, days)
+    """
+    codes, names = encode_schedules([matrix], activities)
+    return codes[0], names
+
+
+class ScheduleStats:
+    """
+    Activity counts for one schedule, computed in a single pass.
+
+    Arrays are indexed by the activity ids in `names`:
+    - totals: (activities,) uses of each activity across all groups
+    - per_group: (groups, activities) histogram of each group's week
+    - per_slot: (periods, days) number of groups with an activity in each slot
+    - per_day: (days, activities) uses of each activity on each day
+    """
+
+    def __init__(self, codes, names):
+        groups, periods, days = codes.shape
+        num_activities = len(names)
+        g, p, d = np.nonzero(codes != EMPTY)
+        a = codes[g, p, d].astype(np.intp)
+
+        self.codes = codes
+        self.names = names
+        self.per_group = np.bincount(g * num_activities + a, minlength=groups * num_activities).reshape(groups, num_activities)
+        self.per_day = np.bincount(d * num_activities + a, minlength=days * num_activities).reshape(days, num_activities)
+        self.per_slot = np.bincount(p * days + d, minlength=periods * days).reshape(periods, days)
+        self.totals = self.per_group.sum(axis=0)
+        for array in (self.codes, self.per_group, self.per_day, self.per_slot, self.totals):
+            array.setflags(write=False)
+
+    @property
+    def activity_counts(self):
+        """Dict of activity name -> total uses, for activities that are used."""
+        return {name: int(count) for name, count in zip(self.names, self.totals) if count}
+
+    @property
+    def total_assignments(self):
+        return int(self.totals.sum())
+
+
+def schedule_stats(matrix):
+    """
+    Return the (cached) statistics for a schedule.
+
+    Results are cached by schedule content, so the charts, exports and the
+    analysis screen all reuse one computation for the same matrix.
+
+    :param matrix: 3d list
+    :return: ScheduleStats
+    """
+    return _cached_stats(tuple(tuple(tuple(period) for period in group) for group in matrix))
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_stats(frozen):
+    if not frozen or not frozen[0]:
+        return ScheduleStats(np.full((len(frozen), 0, 0), EMPTY, dtype=np.int16), [])
+    codes, names = encode_schedule(frozen)
+    return ScheduleStats(codes, names)
+
+
+def compute_metrics(codes, num_activities):
+    """
+    Diversity, fairness and temporal-spread metrics for encoded schedules.
+
+    Every value has the week axis first so that a batch of weeks (or a whole
+    season) is measured in one pass:
+    - distinct: (weeks, groups) number of different activities per group
+    - entropy: (weeks, groups) Shannon entropy of each group's activities, in bits
+    - gini: (weeks, activities) Gini coefficient of each activity's exposure
+      across groups (0 = every group gets it equally often); NaN if unused
+    - spread: (weeks, activities) most minus fewest uses of each activity by a group
+    - mean_gap, min_gap: (weeks,) days between repeats of an activity within
+      a group; NaN if nothing repeats
+    - morning_share: (weeks, groups) fraction of each group's assignments
+      that fall before lunch
+
+    :param codes: int array (weeks, groups, periods, days)
+    :param num_activities: number of activity ids used in `codes`
+    :return: dict of numpy arrays
+    """
+    weeks, groups, periods, days = codes.shape
+    placed = codes[..., None] == np.arange(num_activities)
+
+    per_group = placed.sum(axis=(2, 3))
+    assigned = per_group.sum(axis=-1)
+    share = per_group / np.maximum(assigned, 1)[..., None]
+    logs = np.log2(share, where=share > 0, out=np.zeros_like(share))
+    entropy = -(share * logs).sum(axis=-1)
+
+    mean_use = per_group.mean(axis=1)
+    pair_diffs = np.abs(per_group[:, :, None, :] - per_group[:, None, :, :]).sum(axis=(1, 2))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gini = np.where(mean_use > 0, pair_diffs / (2 * groups * groups * mean_use), np.nan)
+    spread = per_group.max(axis=1) - per_group.min(axis=1) if groups else np.zeros((weeks, num_activities), dtype=int)
+
+    present = placed.any(axis=2)
+    day_index = np.arange(days)[:, None]
+    last_seen = np.maximum.accumulate(np.where(present, day_index, -1), axis=2)
+    previous = np.full_like(last_seen, -1)
+    previous[:, :, 1:] = last_seen[:, :, :-1]
+    repeats = present & (previous >= 0)
+    gaps = np.where(repeats, day_index - previous, 0)
+    repeat_count = repeats.sum(axis=(1, 2, 3))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_gap = np.where(repeat_count > 0, gaps.sum(axis=(1, 2, 3)) / np.maximum(repeat_count, 1), np.nan)
+    min_gap = np.where(repeats, gaps, days + 1).min(axis=(1, 2, 3), initial=days + 1)
+    min_gap = np.where(repeat_count > 0, min_gap, np.nan)
+
+    morning = (codes[:, :, :MORNING_PERIODS] != EMPTY).sum(axis=(2, 3))
+    morning_share = morning / np.maximum(assigned, 1)
+
+    return {
+        "distinct": (per_group > 0).sum(axis=-1),
+        "entropy": entropy,
+        "gini": gini,
+        "spread": spread,
+        "mean_gap": mean_gap,
+        "min_gap": min_gap,
+        "morning_share": morning_share,
+    }
+
+
+def batch_metrics(matrices):
+    """
+    Metrics for a batch of weeks with the same shape (see `compute_metrics`).
+
+    :param matrices: list of 3d lists
+    :return: (metrics, names) where metrics is the dict from `compute_metrics`
+    """
+    codes, names = encode_schedules(matrices)
+    return compute_metrics(codes, len(names)), names
+
+
+def schedule_metrics(matrix):
+    """
+    Summarize the diversity/fairness metrics of one schedule.
+
+    :param matrix: 3d list
+    :return: dict of plain numbers (per-group values as lists)
+    """
+    stats = schedule_stats(matrix)
+    if stats.codes.size == 0:
+        return {}
+    metrics = compute_metrics(stats.codes[None], len(stats.names))
+    used = stats.totals > 0
+    gini = metrics["gini"][0][used]
+    spread = metrics["spread"][0][used]
+    return {
+        "distinct": metrics["distinct"][0].tolist(),
+        "entropy": metrics["entropy"][0].tolist(),
+        "mean_gini": float(gini.mean()) if gini.size else 0.0,
+        "max_spread": int(spread.max()) if spread.size else 0,
+        "mean_gap": float(metrics["mean_gap"][0]),
+        "min_gap": float(metrics["min_gap"][0]),
+        "morning_share": metrics["morning_share"][0].tolist(),
+    }
+
+
+def validate_schedule(matrix, max_uses=DEFAULT_MAX_USES):
+    """
+    Check a complete schedule against the README rules.
+
+    :param matrix: 3d list
+    :param max_uses: weekly limit of the same activity for one group
+    :return: list of violation dicts (see `validate_schedules`)
+    """
+    return validate_schedules([matrix], max_uses)[0]
+
+
+def validate_schedules(matrices, max_uses=DEFAULT_MAX_USES):
+    """
+    Check many schedules against the README rules.
+
+    Schedules with the same shape are stacked and checked together. Each
+    violation is a dict with the keys `rule`, `severity`, `activity`,
+    `message` and `cells`, a list of (group, period, day) coordinates
+    (0-based) of the offending assignments.
+
+    A schedule whose groups or periods differ in length gets a single
+    "shape" violation instead (its cell is (group, period, None), or
+    (group, None, None) for a group with the wrong number of periods) and
+    is left out of the rule checks; the other schedules are still checked.
+    Empty schedules have no violations.
+
+    :param matrices: list of 3d lists
+    :param max_uses: weekly limit of the same activity for one group
+    :return: list with one violation list per schedule, in input order
+    """
+    reports = [[] for _ in matrices]
+
+    by_shape = {}
+    for i, matrix in enumerate(matrices):
+        shape, problem = _shape(matrix)
+        if problem:
+            reports[i].append(problem)
+        elif all(shape):
+            by_shape.setdefault(shape, []).append(i)
+
+    for indices in by_shape.values():
+        codes, names = encode_schedules([matrices[i] for i in indices])
+        found = _check_rules(codes, len(names), max_uses)
+        for w, violations in enumerate(found):
+            for rule, activity, cells in violations:
+                reports[indices[w]].append(_violation(rule, names[activity], cells, max_uses))
+    return reports
+
+
+def _shape(matrix):
+    """
+    Shape of a 3d list, checking that it is rectangular.
+
+    :return: ((groups, periods, days), None), or (None, violation) for the
+        first group or period whose length differs from the first one's
+    """
+    groups = len(matrix)
+    periods = len(matrix[0]) if groups else 0
+    days = len(matrix[0][0]) if periods else 0
+    for g, group in enumerate(matrix):
+        if len(group) != periods:
+            message = f"Group {g + 1} has {len(group)} periods, Group 1 has {periods}"
+            return None, _shape_violation(message, (g, None, None))
+        for p, period in enumerate(group):
+            if len(period) != days:
+                message = f"Group {g + 1} has {len(period)} days in period {p + 1}, expected {days}"
+                return None, _shape_violation(message, (g, p, None))
+    return (groups, periods, days), None
+
+
+def _shape_violation(message, cell):
+    return {
+        "rule": "shape",
+        "severity": SEVERITY["shape"],
+        "activity": None,
+        "message": message,
+        "cells": [cell],
+    }
+
+
+def _check_rules(codes, num_activities, max_uses):
+    """
+    Run every rule over an encoded batch.
+
+    :param codes: int array (weeks, groups, periods, days)
+    :param num_activities: number of activity ids used in `codes`
+    :param max_uses: weekly limit of the same activity for one group
+    :return: per week, a list of (rule, activity id, cells) tuples
+    """
+    weeks = codes.shape[0]
+    found = [[] for _ in range(weeks)]
+    if num_activities == 0:
+        return found
+
+    # placed[w, g, p, d, a] is True where group g has activity a at (p, d)
+    placed = codes[..., None] == np.arange(num_activities)
+
+    # no two groups may share an activity in the same period/day
+    per_slot = placed.sum(axis=1)
+    clash = placed & (per_slot > 1)[:, None]
+    _collect(found, "clash", clash, lambda w, g, p, d, a: (p, d, a))
+
+    # weekly cap per group and activity
+    per_group = placed.sum(axis=(2, 3))
+    over_cap = placed & (per_group > max_uses)[:, :, None, None]
+    _collect(found, "weekly_cap", over_cap, lambda w, g, p, d, a: (g, a))
+
+    # at most once per group per day
+    per_day = placed.sum(axis=2)
+    twice = placed & (per_day > 1)[:, :, None]
+    _collect(found, "once_per_day", twice, lambda w, g, p, d, a: (g, d, a))
+
+    # repeats should have at least one free day between them
+    present = per_day > 0
+    adjacent = present[:, :, :-1] & present[:, :, 1:]
+    no_gap = np.zeros_like(present)
+    no_gap[:, :, :-1] |= adjacent
+    no_gap[:, :, 1:] |= adjacent
+    _collect(found, "day_gap", placed & no_gap[:, :, None], lambda w, g, p, d, a: (g, a))
+
+    # more than two uses should alternate morning and afternoon
+    morning = placed[:, :, :MORNING_PERIODS].any(axis=2)
+    afternoon = placed[:, :, MORNING_PERIODS:].any(axis=2)
+    part = np.where(morning, 1, 0) + np.where(afternoon, 2, 0)
+    days = codes.shape[3]
+    day_index = np.arange(days)[:, None]
+    last_seen = np.maximum.accumulate(np.where(present, day_index, -1), axis=2)
+    previous = np.full_like(last_seen, -1)
+    previous[:, :, 1:] = last_seen[:, :, :-1]
+    previous_part = np.take_along_axis(part, np.clip(previous, 0, None), axis=2)
+    repeated = present & (previous >= 0) & (part == previous_part) & (part != 3)
+    repeated &= (per_group > 2)[:, :, None]
+    _collect(found, "part_of_day", placed & repeated[:, :, None], lambda w, g, p, d, a: (g, a))
+
+    return found
+
+
+def _collect(found, rule, mask, key):
+    """Group the True cells of `mask` into one violation per `key`."""
+    buckets = {}
+    for w, g, p, d, a in zip(*(axis.tolist() for axis in np.nonzero(mask))):
+        bucket = buckets.setdefault((w,) + key(w, g, p, d, a), (w, a, []))
+        bucket[2].append((g, p, d))
+    for w, a, cells in buckets.values():
+        found[w].append((rule, a, cells))
+
+
+def _violation(rule, activity, cells, max_uses):
+    """Build a readable violation record."""
+    groups = sorted({g + 1 for g, _, _ in cells})
+    group_text = ", ".join(f"Group {g}" for g in groups)
+    if rule == "clash":
+        _, p, d = cells[0]
+        message = f"{group_text} all have {activity} in period {p + 1} on day {d + 1}"
+    elif rule == "weekly_cap":
+        message = f"{group_text} has {activity} {len(cells)} times (limit {max_uses})"
+    elif rule == "once_per_day":
+        message = f"{group_text} has {activity} more than once on day {cells[0][2] + 1}"
+    elif rule == "day_gap":
+        days = ", ".join(str(d + 1) for d in sorted({d for _, _, d in cells}))
+        message = f"{group_text} has {activity} on consecutive days ({days})"
+    else:
+        message = f"{group_text} repeats {activity} in the same part of the day"
+    return {
+        "rule": rule,
+        "severity": SEVERITY[rule],
+        "activity": activity,
+        "message": message,
+        "cells": cells,
+    }
@@ -0,0 +1,68 @@
+# Startup benchmark for the GUI.
+# Behavior: starts fresh Python processes that import `ui` and build the main
+# window (offscreen, without entering the event loop), reports the median
+# time, and exits with status 1 when it is over the budget or when one of the
+# heavy export/analysis libraries was imported at startup. Run it from the
+# `bin` folder after changing imports: `python benchmark_startup.py [budget seconds]`.
+# Imports:
+# - subprocess/sys/os: run each measurement in a new interpreter
+# - json/statistics: read the child's result and summarize the runs
+import subprocess
+import sys
+import os
+import json
+import statistics
+
+# modules that must only be loaded when an export or analysis runs
+HEAVY_MODULES = ["numpy", "matplotlib", "PIL", "cv2", "docx", "lxml", "analysis"]
+
+# default time budget for import + window construction, in seconds
+DEFAULT_BUDGET = 1.0
+
+RUNS = 5
+
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+from PyQt5 import QtWidgets
+import ui
+app = QtWidgets.QApplication(sys.argv)
+window = QtWidgets.QMainWindow()
+ui.Ui_MainWindow().setupUi(window)
+elapsed = time.perf_counter() - start
+heavy = [m for m in json.loads(sys.argv[1]) if m in sys.modules]
+print(json.dumps({"seconds": elapsed, "heavy": heavy}))
+"""
+
+
+def measure():
+    '''
+    time one startup in a fresh interpreter
+
+    :return: dict with "seconds" and the "heavy" modules that were imported
+    '''
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    output = subprocess.check_output([sys.executable, "-c", CHILD, json.dumps(HEAVY_MODULES)], env=env)
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def main(budget=DEFAULT_BUDGET):
+    results = [measure() for _ in range(RUNS)]
+    median = statistics.median(r["seconds"] for r in results)
+    heavy = sorted({m for r in results for m in r["heavy"]})
+
+    print("[LOG] Startup (import ui + build window): median {:.3f}s over {} runs, budget {:.3f}s".format(median, RUNS, budget))
+    ok = True
+    if heavy:
+        print("[ERROR] Imported at startup:", ", ".join(heavy))
+        ok = False
+    if median > budget:
+        print("[ERROR] Startup is over budget")
+        ok = False
+    if ok:
+        print("[LOG] OK")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET))
@@ -0,0 +1,26 @@
+"""
+Day names of the weekly schedule matrix.
+
+Kept in a module of its own, without imports, so the solver, the lookup
+index and the exporters can share them without loading one another.
+"""
+
+# day labels of the weekly matrix (it has 4 days)
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday"]
+
+
+def day_index(day):
+    """
+    Turn a day name ("Tuesday", any case) or index into an index.
+
+    :return: int
+    :raises ValueError: unknown name, or an index outside DAYS
+    """
+    if isinstance(day, str):
+        try:
+            return DAYS.index(day.capitalize())
+        except ValueError:
+            raise ValueError(f"Unknown day: {day}")
+    if not 0 <= day < len(DAYS):
+        raise ValueError(f"Day {day} is out of range (0-{len(DAYS) - 1})")
+    return day
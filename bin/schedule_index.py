@@ -0,0 +1,120 @@
+"""
+Lookup indexes over one schedule.
+
+Answers questions about a live week ("which group is on Soccer in period 3
+on Tuesday?", "where is Hockey scheduled?") from precomputed dictionaries
+instead of scanning the nested matrix. The indexes are built once and then
+kept up to date as cells are edited through `ScheduleIndex.set`.
+
+Coordinates are 0-based (group, period, day), like the matrix itself and
+the cells in analysis.py's violation reports. Days may also be given by name.
+"""
+
+# Imports:
+# - days.day_index: lookups by day name (also available from this module)
+from days import day_index
+
+
+class ScheduleIndex:
+    """
+    A schedule matrix together with its lookup indexes.
+
+    The matrix is shared, not copied: edit it through `set` so the indexes
+    stay in step with it.
+    """
+
+    def __init__(self, matrix):
+        self.matrix = matrix
+        # activity -> {(group, period, day)}
+        self._cells = {}
+        # (period, day) -> {group: activity}
+        self._slots = {}
+        # (period, day, activity) -> {group}
+        self._slot_groups = {}
+        # (group, activity) -> number of uses
+        self._uses = {}
+        for g, group in enumerate(matrix):
+            for p, period in enumerate(group):
+                for d, activity in enumerate(period):
+                    self._slots.setdefault((p, d), {})
+                    if activity:
+                        self._add(g, p, d, activity)
+
+    def _add(self, g, p, d, activity):
+        self._cells.setdefault(activity, set()).add((g, p, d))
+        self._slots.setdefault((p, d), {})[g] = activity
+        self._slot_groups.setdefault((p, d, activity), set()).add(g)
+        self._uses[g, activity] = self._uses.get((g, activity), 0) + 1
+
+    def _remove(self, g, p, d, activity):
+        cells = self._cells[activity]
+        cells.discard((g, p, d))
+        if not cells:
+            del self._cells[activity]
+        del self._slots[p, d][g]
+        groups = self._slot_groups[p, d, activity]
+        groups.discard(g)
+        if not groups:
+            del self._slot_groups[p, d, activity]
+        self._uses[g, activity] -= 1
+        if not self._uses[g, activity]:
+            del self._uses[g, activity]
+
+    def set(self, group, period, day, activity):
+        """
+        Change one cell of the matrix and update the indexes.
+
+        :param activity: new activity name, or "" to clear the cell
+        :return: the previous activity ("" if the cell was empty)
+        :raises IndexError: the cell is outside the matrix (nothing is changed)
+        """
+        day = day_index(day)
+        # check the cell before any index is touched, so they stay in step
+        if not (0 <= group < len(self.matrix) and 0 <= period < len(self.matrix[group])
+                and day < len(self.matrix[group][period])):
+            raise IndexError(f"Cell (group {group}, period {period}, day {day}) is outside the schedule")
+        old = self.matrix[group][period][day]
+        if old == activity:
+            return old
+        if old:
+            self._remove(group, period, day, old)
+        self.matrix[group][period][day] = activity
+        if activity:
+            self._add(group, period, day, activity)
+        return old
+
+    def slots(self, activity):
+        """
+        Every cell where an activity is scheduled.
+
+        :return: sorted list of (group, period, day)
+        """
+        return sorted(self._cells.get(activity, ()))
+
+    def groups_on(self, activity, period, day):
+        """
+        Groups doing an activity in one slot (normally at most one).
+
+        :return: sorted list of group indexes
+        """
+        return sorted(self._slot_groups.get((period, day_index(day), activity), ()))
+
+    def slot(self, period, day):
+        """
+        What every group is doing in one slot.
+
+        :return: dict of group index -> activity (empty cells left out)
+        """
+        return dict(self._slots.get((period, day_index(day)), {}))
+
+    def activity_at(self, group, period, day):
+        """The activity of one cell ("" if empty)."""
+        return self._slots.get((period, day_index(day)), {}).get(group, "")
+
+    def uses(self, group, activity):
+        """How many times a group has an activity this week."""
+        return self._uses.get((group, activity), 0)
+
+    def activities(self):
+        """Names of the scheduled activities, sorted."""
+        return sorted(self._cells)
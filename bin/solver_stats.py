@@ -0,0 +1,84 @@
+"""
+Counters for the schedule solver in ui.py.
+
+Profiling is off by default. Turn it on with `Ui_MainWindow.profile` (or
+`python ui.py --profile`), or register node hooks, and every solver run
+fills in a SolveStats: how many cells were tried and undone, how often
+`valid()` was asked, how much the up-front propagation pruned, how often
+the search started over and how long each phase took. When profiling is
+off the solver runs its plain methods, so the counters cost nothing.
+"""
+
+# Imports:
+# - time: phase timings
+# - contextlib: `SolveStats.phase` as a with-block
+import time
+import contextlib
+
+
+class SolveStats:
+    """
+    Counters of one solver run.
+
+    - nodes: activities put in a cell
+    - backtracks: assignments undone
+    - valid_calls: calls of `valid()` (including the ones building the domains)
+    - propagations: (cell, activity) pairs pruned before the search
+    - restarts: times the search was prepared again after it had run
+      (repair neighborhoods, daily fallbacks, alternative restarts)
+    - max_depth: most free cells filled at once
+    - phases: phase name ("prepare", "search") -> seconds
+    """
+
+    def __init__(self):
+        self.nodes = 0
+        self.backtracks = 0
+        self.valid_calls = 0
+        self.propagations = 0
+        self.restarts = 0
+        self.max_depth = 0
+        self.phases = {}
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Add the time spent in the with-block to `phases[name]`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def as_dict(self):
+        return {
+            "nodes": self.nodes,
+            "backtracks": self.backtracks,
+            "valid_calls": self.valid_calls,
+            "propagations": self.propagations,
+            "restarts": self.restarts,
+            "max_depth": self.max_depth,
+            "phases": dict(self.phases),
+        }
+
+    def __str__(self):
+        phases = ", ".join(f"{name} {seconds * 1000:.1f}ms" for name, seconds in self.phases.items())
+        return (f"{self.nodes} nodes, {self.backtracks} backtracks, {self.valid_calls} valid() calls, "
+                f"{self.propagations} pruned, {self.restarts} restarts, depth {self.max_depth}"
+                + (f" ({phases})" if phases else ""))
+
+
+class SolveResult:
+    """
+    Outcome of a solve: true if a schedule was found.
+
+    `stats` is the run's SolveStats, or None when profiling was off.
+    """
+
+    def __init__(self, solved, stats=None):
+        self.solved = solved
+        self.stats = stats
+
+    def __bool__(self):
+        return self.solved
+
+    def __repr__(self):
+        return f"SolveResult(solved={self.solved}, stats={self.stats})"
@@ -0,0 +1,515 @@
+"""
+Persistent storage of generated schedules.
+
+- ScheduleStore: SQLite store. Every saved week is kept as one row per
+  filled (group, period, day) cell, together with the week's configuration
+  and per-group activity counts, so questions about a whole season ("how
+  often has Group 3 had Tennis?") are answered by an indexed query instead
+  of re-reading exported files. A week is identified by its season (camp,
+  year, ...; "" if unused) and name, so "Week 1" of two seasons are kept apart. Groups, periods and days are stored
+  1-based, as they are labelled in the exports ("Group 3", "Period 1",
+  day 1 = Monday).
+- SeasonArchive: compact binary file of encoded weeks (see analysis.py)
+  for long-range analytics, opened with numpy.memmap so a whole season
+  is available as one (weeks, groups, periods, days) array without parsing.
+- SolveCache: solver results keyed by a hash of the settings and seed,
+  so a seeded week that was solved before is not searched again.
+"""
+
+# Imports:
+# - sqlite3: the store itself (one file, no server)
+# - json: week configuration values and the archive's name table
+# - time: when a week was saved
+# - os/struct/numpy: the binary season archive
+# - analysis: encoding schedules as activity ids
+# - hashlib: keys of the solver result cache
+import sqlite3
+import json
+import time
+import os
+import struct
+import hashlib
+import numpy as np
+from analysis import EMPTY, encode_schedule
+
+
+# default store location, next to the exported files
+STORE_PATH = "Generated Schedules/schedules.db"
+
+# default archive location
+ARCHIVE_PATH = "Generated Schedules/season.sched"
+
+# archive header: magic, version, groups, periods, days, unused, weeks,
+# bytes used by the name table, bytes reserved for the name table
+ARCHIVE_MAGIC = b"SCHEDARC"
+ARCHIVE_VERSION = 1
+ARCHIVE_HEADER = struct.Struct("<8sHHHHHIQQ")
+ARCHIVE_HEADER_SIZE = 64
+
+# room reserved for the name table when an archive is created; it is
+# rewritten with twice the room if the names outgrow it
+ARCHIVE_TABLE_SIZE = 64 * 1024
+
+# default solver result cache location, and how many results it keeps
+SOLVE_CACHE_PATH = "Generated Schedules/solve_cache.db"
+SOLVE_CACHE_SIZE = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS weeks (
+    id INTEGER PRIMARY KEY,
+    season TEXT NOT NULL DEFAULT '',
+    name TEXT NOT NULL,
+    saved REAL NOT NULL,
+    groups INTEGER NOT NULL,
+    periods INTEGER NOT NULL,
+    days INTEGER NOT NULL,
+    UNIQUE (season, name)
+);
+CREATE TABLE IF NOT EXISTS activities (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS assignments (
+    week_id INTEGER NOT NULL REFERENCES weeks(id) ON DELETE CASCADE,
+    group_no INTEGER NOT NULL,
+    period INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    activity_id INTEGER NOT NULL REFERENCES activities(id),
+    PRIMARY KEY (week_id, group_no, period, day)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS assignments_by_activity ON assignments (activity_id, group_no, week_id);
+CREATE INDEX IF NOT EXISTS assignments_by_group ON assignments (group_no, week_id);
+CREATE TABLE IF NOT EXISTS config (
+    week_id INTEGER NOT NULL REFERENCES weeks(id) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (week_id, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS stats (
+    week_id INTEGER NOT NULL REFERENCES weeks(id) ON DELETE CASCADE,
+    group_no INTEGER NOT NULL,
+    activity_id INTEGER NOT NULL REFERENCES activities(id),
+    uses INTEGER NOT NULL,
+    PRIMARY KEY (week_id, group_no, activity_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS stats_by_activity ON stats (activity_id, group_no);
+"""
+
+
+class ScheduleStore:
+    """
+    A connection to the schedule store; use one per thread.
+
+    Usable as a context manager (closes the connection on exit).
+    """
+
+    def __init__(self, path=STORE_PATH):
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        # concurrent export pipelines may write at the same time: wait for the lock
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def save_week(self, name, matrix, config=None, season=""):
+        """
+        Store (or replace) one week's schedule in a single transaction.
+
+        :param name: week name, e.g. "Week 1"
+        :param matrix: 3d list (group -> period -> day)
+        :param config: dict of JSON-serializable settings to keep with the week
+        :param season: season or camp the week belongs to
+        :return: None
+        """
+        cells = [
+            (g + 1, p + 1, d + 1, activity)
+            for g, group in enumerate(matrix)
+            for p, period in enumerate(group)
+            for d, activity in enumerate(period)
+            if activity
+        ]
+        periods = max((len(group) for group in matrix), default=0)
+        days = max((len(period) for group in matrix for period in group), default=0)
+
+        with self.conn:
+            self.conn.execute("DELETE FROM weeks WHERE season = ? AND name = ?", (season, name))
+            week_id = self.conn.execute(
+                "INSERT INTO weeks (season, name, saved, groups, periods, days) VALUES (?, ?, ?, ?, ?, ?)",
+                (season, name, time.time(), len(matrix), periods, days),
+            ).lastrowid
+            ids = self._activity_ids({activity for *_, activity in cells})
+
+            self.conn.executemany(
+                "INSERT INTO assignments (week_id, group_no, period, day, activity_id) VALUES (?, ?, ?, ?, ?)",
+                [(week_id, g, p, d, ids[activity]) for g, p, d, activity in cells],
+            )
+            uses = {}
+            for g, _, _, activity in cells:
+                key = (g, ids[activity])
+                uses[key] = uses.get(key, 0) + 1
+            self.conn.executemany(
+                "INSERT INTO stats (week_id, group_no, activity_id, uses) VALUES (?, ?, ?, ?)",
+                [(week_id, g, a, count) for (g, a), count in uses.items()],
+            )
+            self.conn.executemany(
+                "INSERT INTO config (week_id, key, value) VALUES (?, ?, ?)",
+                [(week_id, key, json.dumps(value)) for key, value in (config or {}).items()],
+            )
+
+    def _activity_ids(self, names):
+        """Return {name: id}, adding names that are not in the store yet."""
+        self.conn.executemany("INSERT OR IGNORE INTO activities (name) VALUES (?)", [(n,) for n in names])
+        return dict(self.conn.execute("SELECT name, id FROM activities"))
+
+    def weeks(self, season=""):
+        """Names of a season's stored weeks, oldest save first."""
+        return [name for name, in self.conn.execute(
+            "SELECT name FROM weeks WHERE season = ? ORDER BY saved, id", (season,))]
+
+    def seasons(self):
+        """Seasons with stored weeks, sorted."""
+        return [season for season, in self.conn.execute("SELECT DISTINCT season FROM weeks ORDER BY season")]
+
+    def load_week(self, name, season=""):
+        """
+        Rebuild a stored week's matrix (empty cells come back as "").
+
+        :return: 3d list, or None if the week is not stored
+        """
+        row = self.conn.execute(
+            "SELECT id, groups, periods, days FROM weeks WHERE season = ? AND name = ?", (season, name)).fetchone()
+        if row is None:
+            return None
+        week_id, groups, periods, days = row
+        matrix = [[[""] * days for _ in range(periods)] for _ in range(groups)]
+        for g, p, d, activity in self.conn.execute(
+                "SELECT group_no, period, day, activities.name FROM assignments "
+                "JOIN activities ON activities.id = activity_id WHERE week_id = ?", (week_id,)):
+            matrix[g - 1][p - 1][d - 1] = activity
+        return matrix
+
+    def week_config(self, name, season=""):
+        """The config dict saved with a week."""
+        return {
+            key: json.loads(value) for key, value in self.conn.execute(
+                "SELECT key, value FROM config JOIN weeks ON weeks.id = week_id "
+                "WHERE weeks.season = ? AND weeks.name = ?", (season, name))
+        }
+
+    def activity_count(self, group, activity, weeks=None, season=None):
+        """
+        How many times a group had an activity, over all weeks or the given ones.
+
+        :param group: 1-based group number
+        :param activity: activity name
+        :param weeks: list of week names (default: every stored week)
+        :param season: only count this season's weeks (default: every season;
+            with `weeks`, the weeks of season "")
+        :return: int
+        """
+        sql = ("SELECT COALESCE(SUM(uses), 0) FROM stats JOIN activities ON activities.id = activity_id "
+               "WHERE activities.name = ? AND group_no = ?")
+        args = [activity, group]
+        if weeks is not None:
+            sql += " AND week_id IN (SELECT id FROM weeks WHERE season = ? AND name IN ({}))".format(
+                ",".join("?" * len(weeks)))
+            args += [season or ""] + list(weeks)
+        elif season is not None:
+            sql += " AND week_id IN (SELECT id FROM weeks WHERE season = ?)"
+            args.append(season)
+        return self.conn.execute(sql, args).fetchone()[0]
+
+    def group_history(self, group, season=None):
+        """
+        Every activity a group has had and how often, over all stored weeks.
+
+        :param group: 1-based group number
+        :param season: only count this season's weeks (default: every season)
+        :return: dict of activity name -> uses, most used first
+        """
+        sql = ("SELECT activities.name, SUM(uses) AS total FROM stats JOIN activities ON activities.id = activity_id "
+               "WHERE group_no = ?")
+        args = [group]
+        if season is not None:
+            sql += " AND week_id IN (SELECT id FROM weeks WHERE season = ?)"
+            args.append(season)
+        sql += " GROUP BY activity_id ORDER BY total DESC, activities.name"
+        return dict(self.conn.execute(sql, args))
+
+    def activity_slots(self, activity, week, season=""):
+        """
+        Where an activity is scheduled in one week.
+
+        :return: list of 1-based (group, period, day)
+        """
+        return self.conn.execute(
+            "SELECT group_no, period, day FROM assignments "
+            "WHERE activity_id = (SELECT id FROM activities WHERE name = ?) "
+            "AND week_id = (SELECT id FROM weeks WHERE season = ? AND name = ?) ORDER BY group_no, period, day",
+            (activity, season, week)).fetchall()
+
+
+def save_export(export, path=STORE_PATH):
+    """
+    Store a word.ScheduleExport (the export pipeline's "Store" stage).
+
+    :return: None
+    """
+    with ScheduleStore(path) as store:
+        store.save_week(export.name, export.matrix, {"activities": export.activities}, export.season)
+
+
+class SeasonArchive:
+    """
+    Appendable binary archive of weekly schedules.
+
+    File layout (little-endian):
+    - a 64-byte header (ARCHIVE_HEADER): shape of every week and week count
+    - the name table: JSON {"activities": [...], "weeks": [...]} in a
+      reserved, zero-padded region, so adding names does not move the data
+    - the weeks: int16 activity ids, one (groups, periods, days) block per
+      week, EMPTY for blank cells
+
+    Every week has the archive's shape; weeks with fewer groups, periods
+    or days are padded with EMPTY. A larger week grows the shape: the file
+    is rewritten with the archived weeks padded to the new size.
+    """
+
+    def __init__(self, path=ARCHIVE_PATH):
+        self.path = path
+        with open(path, "rb") as f:
+            header = f.read(ARCHIVE_HEADER_SIZE)
+            if len(header) < ARCHIVE_HEADER_SIZE or header[:8] != ARCHIVE_MAGIC:
+                raise ValueError(f"{path} is not a schedule archive")
+            _, version, groups, periods, days, _, weeks, table_size, self.table_capacity = \
+                ARCHIVE_HEADER.unpack_from(header)
+            if version != ARCHIVE_VERSION:
+                raise ValueError(f"{path}: unsupported archive version {version}")
+            table = json.loads(f.read(table_size).decode("utf-8"))
+        self.shape = (groups, periods, days)
+        self.activities = table["activities"]
+        self.weeks = table["weeks"]
+        if len(self.weeks) != weeks:
+            raise ValueError(f"{path}: header and name table disagree on the number of weeks")
+        self._codes = None
+
+    @classmethod
+    def create(cls, path, groups, periods, days):
+        """
+        Start an empty archive for weeks of the given shape.
+
+        :return: SeasonArchive
+        """
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "wb") as f:
+            _write_archive_head(f, (groups, periods, days), 0, {"activities": [], "weeks": []}, ARCHIVE_TABLE_SIZE)
+        return cls(path)
+
+    @classmethod
+    def open_or_create(cls, path, matrix):
+        """Open the archive at `path`, or create one shaped like `matrix`."""
+        if os.path.exists(path):
+            return cls(path)
+        periods = max((len(group) for group in matrix), default=0)
+        days = max((len(period) for group in matrix for period in group), default=0)
+        return cls.create(path, len(matrix), periods, days)
+
+    @property
+    def data_offset(self):
+        return ARCHIVE_HEADER_SIZE + self.table_capacity
+
+    @property
+    def codes(self):
+        """
+        Every week as a read-only (weeks, groups, periods, days) int16 array.
+
+        The array is memory-mapped: slicing it reads only the weeks used.
+        """
+        if self._codes is None:
+            shape = (len(self.weeks),) + self.shape
+            if not self.weeks:
+                self._codes = np.empty(shape, dtype="<i2")
+            else:
+                self._codes = np.memmap(self.path, dtype="<i2", mode="r", offset=self.data_offset, shape=shape)
+        return self._codes
+
+    def append_week(self, name, matrix):
+        """
+        Encode a week and add it to the end of the archive; a week that is
+        already archived under the same name is replaced in place.
+
+        :param name: week name
+        :param matrix: 3d list; the archive grows if it is larger than its shape
+        :return: None
+        """
+        codes, names = encode_schedule(matrix, self.activities)
+        shape = tuple(max(old, new) for old, new in zip(self.shape, codes.shape))
+        if shape != self.shape:
+            self._rewrite(shape=shape)
+        block = np.full(self.shape, EMPTY, dtype="<i2")
+        block[:codes.shape[0], :codes.shape[1], :codes.shape[2]] = codes
+
+        index = self.weeks.index(name) if name in self.weeks else len(self.weeks)
+        table = {"activities": names, "weeks": self.weeks[:index] + [name] + self.weeks[index + 1:]}
+        if len(_encode_table(table)) > self.table_capacity:
+            self._rewrite(capacity=2 * max(self.table_capacity, len(_encode_table(table))))
+
+        # data first, then the table and header that make it visible
+        self._codes = None
+        with open(self.path, "r+b") as f:
+            f.seek(self.data_offset + index * block.nbytes)
+            f.write(block.tobytes())
+            _write_archive_head(f, self.shape, len(table["weeks"]), table, self.table_capacity)
+        self.activities = names
+        self.weeks = table["weeks"]
+
+    def _rewrite(self, shape=None, capacity=None):
+        """
+        Rewrite the archive with a larger week shape (padding every week
+        with EMPTY) and/or more room for the name table.
+        """
+        shape = shape or self.shape
+        capacity = capacity or self.table_capacity
+        tmp_path = self.path + ".tmp"
+        weeks = self.codes
+        with open(tmp_path, "wb") as dst:
+            table = {"activities": self.activities, "weeks": self.weeks}
+            _write_archive_head(dst, shape, len(self.weeks), table, capacity)
+            dst.seek(ARCHIVE_HEADER_SIZE + capacity)
+            block = np.empty(shape, dtype="<i2")
+            for week in weeks:
+                block.fill(EMPTY)
+                block[:week.shape[0], :week.shape[1], :week.shape[2]] = week
+                dst.write(block.tobytes())
+        # drop the memory map before the file is replaced
+        del weeks
+        self._codes = None
+        os.replace(tmp_path, self.path)
+        self.shape = shape
+        self.table_capacity = capacity
+
+    def week(self, key):
+        """
+        Decode one week back into a 3d list ("" for empty cells).
+
+        :param key: week name or index
+        :return: 3d list
+        """
+        index = self.weeks.index(key) if isinstance(key, str) else key
+        names = self.activities + [""]
+        return [[[names[code] for code in period] for period in group] for group in self.codes[index].tolist()]
+
+
+def _encode_table(table):
+    return json.dumps(table, separators=(",", ":")).encode("utf-8")
+
+
+def _write_archive_head(f, shape, weeks, table, capacity):
+    """Write the header and the zero-padded name table at the start of `f`."""
+    data = _encode_table(table)
+    f.seek(0)
+    f.write(ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, *shape, 0, weeks, len(data), capacity).ljust(ARCHIVE_HEADER_SIZE, b"\0"))
+    f.write(data.ljust(capacity, b"\0"))
+
+
+def archive_export(export, path=ARCHIVE_PATH):
+    """
+    Add a word.ScheduleExport to the season archive (the export pipeline's
+    "Archive" stage), as "<season>/<name>" when it has a season.
+
+    :return: None
+    """
+    name = f"{export.season}/{export.name}" if export.season else export.name
+    SeasonArchive.open_or_create(path, export.matrix).append_week(name, export.matrix)
+
+
+SOLVE_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    matrix TEXT NOT NULL,
+    used INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_by_use ON results (used);
+"""
+
+
+def solve_key(settings):
+    """
+    Canonical hash of solver settings.
+
+    :param settings: JSON-serializable dict; key order does not matter
+    :return: hex string
+    """
+    text = json.dumps(settings, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class SolveCache:
+    """
+    Solved matrices keyed by `solve_key`, evicting the least recently used
+    beyond `max_entries`.
+
+    Usable as a context manager (closes the connection on exit).
+    """
+
+    def __init__(self, path=SOLVE_CACHE_PATH, max_entries=SOLVE_CACHE_SIZE):
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.max_entries = max_entries
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.executescript(SOLVE_CACHE_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def get(self, key):
+        """
+        A cached result, marked as just used.
+
+        :return: 3d list, or None if the key is not cached
+        """
+        with self.conn:
+            row = self.conn.execute("SELECT matrix FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self.conn.execute(
+                "UPDATE results SET used = (SELECT MAX(used) + 1 FROM results) WHERE key = ?", (key,))
+        return json.loads(row[0])
+
+    def put(self, key, matrix):
+        """
+        Cache a result and evict the least recently used ones over the limit.
+
+        :return: None
+        """
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO results (key, matrix, used) "
+                "VALUES (?, ?, (SELECT COALESCE(MAX(used), 0) + 1 FROM results))",
+                (key, json.dumps(matrix, separators=(",", ":"), ensure_ascii=False)))
+            self.conn.execute(
+                "DELETE FROM results WHERE key IN "
+                "(SELECT key FROM results ORDER BY used DESC LIMIT -1 OFFSET ?)", (self.max_entries,))
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
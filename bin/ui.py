@@ -14,25 +14,33 @@ rename/move it to `ui.py` (you may need to remove or back up the existing `ui.py
 # Standard GUI and utility imports:
 # - PyQt5.*: main GUI toolkit (windows, dialogs, widgets, layouts)
 # - `word` module: local helper for exporting generated schedules to .docx
+#   (it loads python-docx, Matplotlib and Pillow only when an export runs)
+# - `days`: day names of the weekly matrix
+# - `schedule_index`: slot/activity lookups on the current week
+# - `solver_stats`: counters and results of solver runs
 # - traceback/time/random: debugging, timing and randomized behavior
-# - json/csv/os: export and filesystem utilities
-# - numpy/matplotlib: basic numeric analysis and plotting for charts
-# - PIL (Pillow): simple image export helper
-# - cv2: OpenCV, included for optional image processing (may be unused)
+# - collections: bounded cache of recent alternative schedules
+# - contextlib: phase timing that does nothing when profiling is off
+# The solver result cache (store.py) loads NumPy and is imported in `solve_week()`.
+# NumPy and the `analysis` module are imported inside `analyze()`, so the
+# window does not wait on them at startup; see benchmark_startup.py.
 from PyQt5 import QtCore, QtGui, QtWidgets
 from PyQt5.QtWidgets import QMessageBox, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QListWidget, QListWidgetItem, QSpinBox, QComboBox
 from PyQt5.QtCore import Qt
-from word import make_word_doc, make_word_doc_only
+from word import ScheduleExport, export_stage, load_schedule, make_word_doc
+from days import DAYS, day_index
+from schedule_index import ScheduleIndex
+from solver_stats import SolveResult, SolveStats
 import traceback
 import time
 import random
-import json
-import csv
-import os
-import numpy as np
-import matplotlib.pyplot as plt
-from PIL import Image, ImageDraw
-import cv2
+import collections
+import contextlib
+
+
+# part of every solver cache key: bump it when a change to the search
+# changes which schedule a given seed produces
+SOLVER_VERSION = 2
 
 
 class ActivityManagerDialog(QDialog):
@@ -197,6 +205,110 @@ class GroupOrganizerDialog(QDialog):
         return self.groups
 
 
+class PinDialog(QDialog):
+    """Dialog for pinning cells the solver must keep as they are"""
+
+    NO_ACTIVITY = "(no activity)"
+
+    def __init__(self, pins=None, num_groups=0, num_periods=6, activities=None, index=None, parent=None):
+        super().__init__(parent)
+        self.pins = dict(pins) if pins else {}
+        # ScheduleIndex of the current week: the chosen cell's activity is offered first
+        self.index = index
+        self.num_groups = num_groups
+        self.num_periods = num_periods
+        self.activities = activities if activities else []
+        self.setWindowTitle("Pin Cells")
+        self.setGeometry(100, 100, 450, 350)
+        self.initUI()
+
+    def initUI(self):
+        layout = QVBoxLayout()
+
+        title = QLabel("Pinned Cells")
+        title.setStyleSheet("font-weight: bold; font-size: 14px;")
+        layout.addWidget(title)
+
+        input_layout = QHBoxLayout()
+        self.group_combo = QComboBox()
+        for g in range(self.num_groups):
+            self.group_combo.addItem(f"Group {g+1}")
+        self.day_combo = QComboBox()
+        self.day_combo.addItems(DAYS)
+        self.period_spin = QSpinBox()
+        self.period_spin.setMinimum(1)
+        self.period_spin.setMaximum(max(1, self.num_periods))
+        self.period_spin.setPrefix("Period ")
+        # editable, so fixed events that are not in the rotation can be pinned too
+        self.activity_combo = QComboBox()
+        self.activity_combo.setEditable(True)
+        self.activity_combo.addItems(self.activities + [self.NO_ACTIVITY])
+        add_btn = QPushButton("Pin")
+        add_btn.clicked.connect(self.add_pin)
+        for widget in (self.group_combo, self.day_combo, self.period_spin, self.activity_combo, add_btn):
+            input_layout.addWidget(widget)
+        layout.addLayout(input_layout)
+        self.group_combo.currentIndexChanged.connect(self.show_current)
+        self.day_combo.currentIndexChanged.connect(self.show_current)
+        self.period_spin.valueChanged.connect(self.show_current)
+        self.show_current()
+
+        self.pin_list = QListWidget()
+        layout.addWidget(self.pin_list)
+        self.refresh_list()
+
+        remove_layout = QHBoxLayout()
+        remove_btn = QPushButton("Remove Selected")
+        remove_btn.clicked.connect(self.remove_pin)
+        remove_layout.addWidget(remove_btn)
+        remove_layout.addStretch()
+        layout.addLayout(remove_layout)
+
+        btn_layout = QHBoxLayout()
+        ok_btn = QPushButton("OK")
+        cancel_btn = QPushButton("Cancel")
+        ok_btn.clicked.connect(self.accept)
+        cancel_btn.clicked.connect(self.reject)
+        btn_layout.addWidget(ok_btn)
+        btn_layout.addWidget(cancel_btn)
+        layout.addLayout(btn_layout)
+
+        self.setLayout(layout)
+
+    def refresh_list(self):
+        self.pin_list.clear()
+        for (g, p, d), activity in sorted(self.pins.items()):
+            item = QListWidgetItem(f"Group {g+1}, {DAYS[d]} period {p+1}: {activity or self.NO_ACTIVITY}")
+            item.setData(Qt.UserRole, (g, p, d))
+            self.pin_list.addItem(item)
+
+    def show_current(self):
+        """Preselect the activity the chosen cell has in the current schedule."""
+        if self.index is None or self.group_combo.currentIndex() < 0:
+            return
+        activity = self.index.activity_at(self.group_combo.currentIndex(), self.period_spin.value() - 1, self.day_combo.currentIndex())
+        if activity:
+            self.activity_combo.setCurrentText(activity)
+
+    def add_pin(self):
+        if self.group_combo.currentIndex() < 0:
+            return
+        activity = self.activity_combo.currentText().strip()
+        if activity == self.NO_ACTIVITY:
+            activity = ""
+        cell = (self.group_combo.currentIndex(), self.period_spin.value() - 1, self.day_combo.currentIndex())
+        self.pins[cell] = activity
+        self.refresh_list()
+
+    def remove_pin(self):
+        for item in self.pin_list.selectedItems():
+            self.pins.pop(item.data(Qt.UserRole), None)
+        self.refresh_list()
+
+    def get_pins(self):
+        return self.pins
+
+
 class Ui_MainWindow(object):
     """Main UI class for Schedule Creator"""
     
@@ -247,6 +359,9 @@ class Ui_MainWindow(object):
         self.group_organizer_btn = QPushButton("Organize Groups")
         self.group_organizer_btn.clicked.connect(self.open_group_organizer)
         group_layout.addWidget(self.group_organizer_btn)
+        self.pin_btn = QPushButton("Pin Cells")
+        self.pin_btn.clicked.connect(self.open_pin_dialog)
+        group_layout.addWidget(self.pin_btn)
         group_layout.addStretch()
         layout.addLayout(group_layout)
         
@@ -268,6 +383,24 @@ class Ui_MainWindow(object):
         for i in range(1, 8):
             self.week_combo.addItem(f"Week {i}")
         week_layout.addWidget(self.week_combo)
+        # weeks are kept per season in the schedule store
+        week_layout.addWidget(QLabel("Season:"))
+        self.season_edit = QLineEdit()
+        self.season_edit.setPlaceholderText("e.g. Summer 2026")
+        self.season_edit.setToolTip("Weeks with the same name in different seasons are stored separately")
+        week_layout.addWidget(self.season_edit)
+        # daily mode: generate one day at a time, keeping the earlier days
+        week_layout.addWidget(QLabel("Generate:"))
+        self.day_combo = QComboBox()
+        self.day_combo.addItems(["Whole week"] + DAYS)
+        week_layout.addWidget(self.day_combo)
+        # a fixed seed gives the same schedule every time and is solved only once
+        week_layout.addWidget(QLabel("Seed:"))
+        self.seed_spin = QSpinBox()
+        self.seed_spin.setRange(0, 999999)
+        self.seed_spin.setSpecialValueText("Random")
+        self.seed_spin.setToolTip("Same seed and settings give the same schedule; Random picks a new one each time")
+        week_layout.addWidget(self.seed_spin)
         week_layout.addStretch()
         layout.addLayout(week_layout)
         
@@ -275,6 +408,16 @@ class Ui_MainWindow(object):
         self.generate_btn.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; padding: 10px;")
         self.generate_btn.clicked.connect(self.generate_schedule)
         layout.addWidget(self.generate_btn)
+
+        # re-plan the current week around a cancelled activity
+        self.cancel_btn = QPushButton("Cancel Activity")
+        self.cancel_btn.clicked.connect(self.cancel_activity)
+        layout.addWidget(self.cancel_btn)
+
+        # flip through other valid schedules for the same settings
+        self.alternative_btn = QPushButton("Next Alternative")
+        self.alternative_btn.clicked.connect(self.next_alternative)
+        layout.addWidget(self.alternative_btn)
         
         export_layout = QHBoxLayout()
         export_layout.addWidget(QLabel("Export:"))
@@ -304,6 +447,11 @@ class Ui_MainWindow(object):
         analyze_btn = QPushButton("Analyze")
         analyze_btn.clicked.connect(self.analyze)
         export_layout.addWidget(analyze_btn)
+
+        # reload a previously exported schedule (.json/.csv/.docx)
+        load_btn = QPushButton("Load")
+        load_btn.clicked.connect(self.load_schedule)
+        export_layout.addWidget(load_btn)
         
         export_layout.addStretch()
         layout.addLayout(export_layout)
@@ -320,8 +468,18 @@ class Ui_MainWindow(object):
             "Group 4": ["Grace", "Henry"]
         }
         self.matrix = None
+        self._index = None
         self.start_time = None
         self.max_activity_uses = 2  # how many times each activity can be used per group
+        self.pins = {}  # (group, period, day) -> activity kept fixed by the solver ("" = no activity)
+        self.time_limit = 5  # seconds before the solver gives up
+        self.rng = random.Random()  # every random choice of the solver; seeded for reproducible runs
+        self.profile = False  # count solver work in self.stats (see solver_stats.py)
+        self.node_hooks = []  # hook(stats, pos, activity, depth) called for every assignment; turns on profiling
+        self.stats = None  # SolveStats of the latest solver run, None when profiling is off
+        self.alternatives_cache_size = 20  # recent alternatives compared for diversity
+        self._alternatives = None  # (settings, generator) behind "Next Alternative"
+        self._alternative_count = 0
         self.update_group_display()
     
     def open_activity_manager(self):
@@ -345,6 +503,17 @@ class Ui_MainWindow(object):
             print(tb)
             QMessageBox.critical(None, "Group Organizer Error", f"An error occurred opening Group Organizer:\n{str(e)}\n\nSee console for traceback.")
     
+    def open_pin_dialog(self):
+        try:
+            dialog = PinDialog(self.pins, len(self.groups), self.periods_spin.value(), self.activities,
+                               self.schedule_index(), self.main_window)
+            if dialog.exec_():
+                self.pins = dialog.get_pins()
+        except Exception as e:
+            tb = traceback.format_exc()
+            print(tb)
+            QMessageBox.critical(None, "Pin Cells Error", f"An error occurred opening Pin Cells:\n{str(e)}\n\nSee console for traceback.")
+    
     def generate_schedule(self):
         if not self.activities:
             self.show_error("Please add activities first", "No Activities")
@@ -364,25 +533,29 @@ class Ui_MainWindow(object):
                 self.show_error(msg, "Constraint Violation")
                 return
 
-            # Only weekly mode supported
-            self.matrix = self.generate_weekly_matrix(num_groups)
+            if self.day_combo.currentIndex() > 0:
+                self.generate_day_schedule(self.day_combo.currentText(), num_groups)
+                return
 
-            self.start_time = time.time()
-            if self.solve():
-                make_word_doc(self.matrix, self.week_combo.currentText())
-                try:
-                    self.export_pie()
-                except Exception:
-                    pass
-                self.show_info("Schedule generated successfully!", "Success")
+            seed = self.seed_spin.value() or None
+            solved, issues, cached = self.solve_week(num_groups, seed)
+            if issues:
+                msg = "The pinned cells cannot all be kept:\n\n"
+                msg += "\n".join(f"- {it}" for it in issues[:10])
+                self.show_error(msg, "Pin Conflict")
+                return
+
+            if solved:
+                self.print_stats()
+                make_word_doc(self.matrix, self.week_combo.currentText(), self.activities, self.season())
+                note = f"\n(Reused the saved result for seed {seed})" if cached else ""
+                self.show_info("Schedule generated successfully!" + note, "Success")
             else:
                 # attempt to auto-adjust max_activity_uses if capacity is the issue
-                if self.try_auto_adjust_and_solve(num_groups):
-                    make_word_doc(self.matrix, self.week_combo.currentText())
-                    try:
-                        self.export_pie()
-                    except Exception:
-                        pass
+                adjusted = self.try_auto_adjust_and_solve(num_groups, seed)
+                self.print_stats()
+                if adjusted:
+                    make_word_doc(self.matrix, self.week_combo.currentText(), self.activities, self.season())
                     self.show_info(f"Schedule generated successfully!\n(Adjusted activity limit to {self.max_activity_uses})", "Success")
                 else:
                     # provide more help when solver fails without obvious constraints
@@ -392,6 +565,106 @@ class Ui_MainWindow(object):
             print(tb)
             self.show_error(f"Error: {str(e)}\n\nSee console for traceback.", "Error")
     
+    def next_alternative(self):
+        if not self.activities or not self.groups:
+            self.show_error("Please add activities and organize groups first", "Missing Setup")
+            return
+
+        issues = self.validate_constraints(len(self.groups))
+        if issues:
+            msg = "Cannot generate schedule because of the following constraint(s):\n\n"
+            msg += "\n".join(f"- {it}" for it in issues)
+            self.show_error(msg, "Constraint Violation")
+            return
+        # the search needs enough uses per activity to fill the week, as after a failed generate
+        adjusted = self.adjust_activity_limit(len(self.groups)) is not None
+
+        settings = (tuple(self.activities), len(self.groups), self.periods_spin.value(),
+                    self.max_activity_uses, tuple(sorted(self.pins.items())), self.seed_spin.value())
+        if self._alternatives is None or self._alternatives[0] != settings:
+            seed = self.seed_spin.value() or None
+            self._alternatives = (settings, self.iter_alternatives(len(self.groups), seed=seed))
+            self._alternative_count = 0
+
+        # the generator works in self.matrix; keep the shown schedule if it yields nothing
+        displayed = self.matrix
+        try:
+            try:
+                matrix = next(self._alternatives[1], None)
+            except Exception:
+                self._alternatives = None
+                self.matrix = displayed
+                raise
+            self.print_stats()
+            if matrix is None:
+                self._alternatives = None
+                self.matrix = displayed
+                self.show_error("No more alternative schedules were found for these settings in time.", "No Alternatives")
+                return
+            self._alternative_count += 1
+            self.matrix = matrix
+            make_word_doc(self.matrix, self.week_combo.currentText(), self.activities, self.season())
+            note = f"\n(Adjusted activity limit to {self.max_activity_uses})" if adjusted else ""
+            self.show_info(f"Alternative {self._alternative_count} generated." + note, "Alternative Schedule")
+        except Exception as e:
+            tb = traceback.format_exc()
+            print(tb)
+            self.show_error(f"Error: {str(e)}\n\nSee console for traceback.", "Error")
+
+    def generate_day_schedule(self, day, num_groups):
+        # the later days need enough uses per activity to fill the week, as in Generate
+        adjusted = self.adjust_activity_limit(num_groups) is not None
+        try:
+            solved, notes = self.generate_day(day, num_groups)
+        except ValueError as e:
+            self.show_error(str(e), "Schedule Mismatch")
+            return
+        self.print_stats()
+        if not solved:
+            msg = f"Could not generate {day} with these constraints."
+            if notes:
+                msg += "\n\n" + "\n".join(f"- {it}" for it in notes[:10])
+            self.show_error(msg, "Failed")
+            return
+        make_word_doc(self.matrix, self.week_combo.currentText(), self.activities, self.season())
+        msg = f"{day} generated successfully!"
+        if adjusted:
+            notes = [f"Adjusted activity limit to {self.max_activity_uses}"] + notes
+        if notes:
+            msg += "\n(" + "; ".join(notes) + ")"
+        self.show_info(msg, "Success")
+
+    def cancel_activity(self):
+        if not self.matrix:
+            self.show_error("Generate or load a schedule first", "No Schedule")
+            return
+
+        scheduled = self.schedule_index().activities()
+        activity, ok = QtWidgets.QInputDialog.getItem(self.main_window, "Cancel Activity", "Activity:", scheduled, 0, False)
+        if not ok:
+            return
+        day, ok = QtWidgets.QInputDialog.getItem(self.main_window, "Cancel Activity", "Cancelled on:", ["All week"] + DAYS, 0, False)
+        if not ok:
+            return
+
+        try:
+            changed, issues = self.repair_schedule(activity, None if day == "All week" else [day])
+            if changed is None:
+                if issues:
+                    msg = f"Could not re-plan the week without {activity}:\n\n"
+                    msg += "\n".join(f"- {it}" for it in issues[:10])
+                    msg += "\n\nThe schedule was not changed."
+                else:
+                    msg = f"Could not re-plan the week without {activity} in time.\nThe schedule was not changed."
+                self.show_error(msg, "Repair Failed")
+                return
+            make_word_doc(self.matrix, self.week_combo.currentText(), self.activities, self.season())
+            self.show_info(f"{activity} removed; {len(changed)} cells changed.", "Schedule Repaired")
+        except Exception as e:
+            tb = traceback.format_exc()
+            print(tb)
+            self.show_error(f"Error: {str(e)}\n\nSee console for traceback.", "Error")
+    
     def generate_weekly_matrix(self, num_groups):
         matrix = []
         num_periods = self.periods_spin.value()
@@ -404,179 +677,579 @@ class Ui_MainWindow(object):
             matrix.append(group_matrix)
         return matrix
     
-    def generate_daily_matrix(self, num_groups):
-        # Daily mode removed; keep the function but raise so it is not used.
-        raise NotImplementedError("Daily schedule mode has been removed. Use Weekly mode.")
+    def generate_daily_matrix(self, num_groups, day=0):
+        """
+        Week matrix for generating one day: the days before `day` are copied
+        from the current schedule, `day` and the days after it are blank.
+
+        :raises ValueError: the current schedule does not have the same
+            groups, periods and days, so the earlier days cannot be copied
+        """
+        matrix = self.generate_weekly_matrix(num_groups)
+        if not self.matrix or day == 0:
+            return matrix
+        if len(self.matrix) != num_groups or not all(
+                len(group) == len(matrix[0]) and all(len(period) == len(matrix[0][0]) for period in group)
+                for group in self.matrix):
+            raise ValueError(
+                f"The current schedule does not have {num_groups} groups of {len(matrix[0])} periods, "
+                f"so the days before {DAYS[day]} cannot be kept. Generate the whole week (or Monday) first.")
+        for g, group in enumerate(matrix):
+            for p, period in enumerate(group):
+                period[:day] = self.matrix[g][p][:day]
+        return matrix
+
+    def generate_day(self, day, num_groups=None):
+        """
+        Fill one day of the week, with the earlier days locked (rolling horizon).
+
+        The earlier days count against the weekly limits, a group gets an
+        activity at most once that day, and (when possible) not an activity
+        it had the day before. If the gap rule leaves no solution, the day is
+        solved again without it. Pins are kept. The later days are solved
+        along with it, so the day never uses up what the rest of the week
+        needs, and are then cleared, to be generated after this one; the
+        notes say so when they had activities.
+
+        :param day: day index or name
+        :param num_groups: defaults to the configured groups
+        :return: (solved, notes) where notes lists problems or relaxed rules;
+            the schedule is left unchanged if the day could not be solved
+        :raises ValueError: the current schedule has other groups or periods,
+            so its earlier days cannot be kept
+        """
+        day = day_index(day)
+        num_groups = len(self.groups) if num_groups is None else num_groups
+        self.start_stats()
+        week = self.generate_daily_matrix(num_groups, day)
+        cells = [(g, p, d) for g in range(num_groups) for p in range(len(week[0])) for d in range(len(week[0][0]))]
+        earlier_days = [cell for cell in cells if cell[2] < day]
+
+        # activities each group had the day before
+        gap = {}
+        if day > 0:
+            gap = {(g, day): {period[day - 1] for period in group} - {""} for g, group in enumerate(week)}
+
+        cleared = []
+        if self.matrix and day > 0:
+            cleared = [DAYS[d] for d in range(day + 1, len(week[0][0]))
+                       if any(period[d] for group in self.matrix for period in group)]
+
+        attempts = [(gap, [])]
+        if gap:
+            attempts.append(({}, [f"some groups repeat an activity from {DAYS[day - 1]}"]))
+
+        previous = self.matrix
+        for excluded, notes in attempts:
+            self.matrix = [[period[:] for period in group] for group in week]
+            issues = self.apply_pins()
+            issues += self.prepare_solver(earlier_days, excluded=excluded)
+            self.start_time = time.time()
+            if not issues and self.solve():
+                for g, p, d in cells:
+                    if d > day and (g, p, d) not in self.pins:
+                        self.matrix[g][p][d] = ""
+                if cleared:
+                    notes = notes + [f"{', '.join(cleared)} cleared, to be generated next"]
+                return True, notes
+        self.matrix = previous
+        return False, issues
     
     def solve(self):
-        if time.time() - self.start_time > 5:
+        """
+        Fill the free cells prepared by `prepare_solver()`.
+
+        :return: SolveResult, true if every cell was filled in time
+        """
+        with self._phase("search"):
+            solved = self._solve()
+        return SolveResult(solved, self.stats)
+
+    def _solve(self):
+        if time.time() - self.start_time > self.time_limit:
             return False
         
         find = self.find_empty()
         if not find:
             return True
         
-        group, period, day = find
         # randomize activity order to reduce repetitive first-period assignments
-        choices = self.activities[:]
-        random.shuffle(choices)
+        choices = self._domains[find][:]
+        self.rng.shuffle(choices)
         for activity in choices:
-            if self.valid(activity, (group, period, day)):
-                self.matrix[group][period][day] = activity
+            if self.valid(activity, find):
+                self.assign(find, activity)
                 
-                if self.solve():
+                if self._solve():
                     return True
+                self.unassign(find)
         
-        self.matrix[group][period][day] = ""
         return False
     
+    def _search(self):
+        """Like `solve()`, but yields the matrix at every complete schedule and then keeps searching."""
+        if time.time() - self.start_time > self.time_limit:
+            return
+        
+        find = self.find_empty()
+        if not find:
+            yield self.matrix
+            return
+        
+        choices = self._domains[find][:]
+        self.rng.shuffle(choices)
+        for activity in choices:
+            if self.valid(activity, find):
+                self.assign(find, activity)
+                yield from self._search()
+                self.unassign(find)
+
+    def iter_alternatives(self, num_groups=None, min_distance=None, max_rejects=200, seed=None):
+        """
+        Lazily yield different valid weekly schedules, one per `next()`.
+
+        The search is resumed where the previous schedule was found instead
+        of starting over. A schedule is only yielded if it differs in at
+        least `min_distance` cells from each of the last
+        `alternatives_cache_size` ones; after `max_rejects` schedules in a
+        row that are too similar, the search restarts with a new random order
+        so later results move further away. Each `next()` gets `time_limit`
+        seconds in total, restarts included. The generator stops when every
+        schedule has been seen, when the pins cannot be kept, or when that
+        time passes without a new schedule.
+
+        :param num_groups: defaults to the configured groups
+        :param min_distance: default: a tenth of the cells
+        :param seed: makes the series reproducible
+        :return: generator of 3d lists (copies; the generator keeps its own state)
+        """
+        num_groups = len(self.groups) if num_groups is None else num_groups
+        cells = num_groups * self.periods_spin.value() * 4
+        min_distance = max(1, cells // 10) if min_distance is None else min_distance
+        recent = collections.deque(maxlen=self.alternatives_cache_size)
+
+        self.start_stats()
+        # one deadline per next(): a restart does not get a fresh time limit
+        start = time.time()
+        while True:
+            if self.start_weekly_solve(num_groups, seed):
+                return
+            self.start_time = start
+            # restarts continue the random stream instead of repeating the seed
+            seed = None
+            rejects = 0
+            search = self._search()
+            while True:
+                with self._phase("search"):
+                    matrix = next(search, None)
+                if matrix is None:
+                    break
+                flat = [activity for group in matrix for period in group for activity in period]
+                if any(sum(a != b for a, b in zip(flat, other)) < min_distance for other in recent):
+                    rejects += 1
+                    if rejects >= max_rejects:
+                        break
+                    continue
+                rejects = 0
+                recent.append(flat)
+                state = self._solver_state()
+                yield [[period[:] for period in group] for group in matrix]
+                # the caller may have used the solver in the meantime
+                self._restore_solver_state(state)
+                start = self.start_time = time.time()
+            if time.time() - start > self.time_limit:
+                # nothing new was accepted in this next()'s time
+                return
+            if matrix is None:
+                # every schedule has been seen
+                return
+
+    def _solver_state(self):
+        return (self.matrix, self._fixed, self._slot_used, self._day_used, self._uses,
+                self._domains, self._order, self._filled)
+
+    def _restore_solver_state(self, state):
+        (self.matrix, self._fixed, self._slot_used, self._day_used, self._uses,
+         self._domains, self._order, self._filled) = state
+
     def find_empty(self):
-        for g, group in enumerate(self.matrix):
-            for p, period in enumerate(group):
-                for d, day in enumerate(period):
-                    if day == "":
-                        return (g, p, d)
+        # free cells are filled strictly in `_order`, so the next one is at `_filled`
+        if self._filled < len(self._order):
+            return self._order[self._filled]
         return None
     
     def valid(self, activity, pos):
         g, p, d = pos
-        
-        for group_idx in range(len(self.matrix)):
-            if group_idx != g and self.matrix[group_idx][p][d] == activity:
-                return False
-        
-        count = sum(1 for period in self.matrix[g] for day in period if day == activity)
-        if count >= self.max_activity_uses:
+        # no other group has the activity in this slot, and the group is under its weekly limit
+        if activity in self._slot_used[p, d] or self._uses[g].get(activity, 0) >= self.max_activity_uses:
             return False
-        
-        return True
-    
-    def export_json(self):
-        matrix = self._matrix_or_template()
-        if matrix is None:
-            return
+        # a group does an activity at most once a day
+        return activity not in self._day_used[g, d]
 
-        try:
-            schedule_dict = {}
-            for g, group in enumerate(matrix):
-                schedule_dict[f"Group {g+1}"] = group
+    def prepare_solver(self, fixed=(), banned=(), excluded=None):
+        """
+        Build the solver's incremental state for the current matrix.
 
-            filepath = f"Generated Schedules/{self.week_combo.currentText()}_schedule.json"
-            os.makedirs("Generated Schedules", exist_ok=True)
-            with open(filepath, 'w') as f:
-                json.dump(schedule_dict, f, indent=2)
+        Every non-empty cell counts as already assigned, and the cells in
+        `fixed` (plus the pinned ones) are never changed. The consequences of
+        those assignments are propagated up front: each free cell gets the
+        list of activities still allowed in it, and the free cells are
+        ordered with the most constrained first.
 
-            self.show_info(f"Exported to {filepath}", "Export Complete")
-        except Exception as e:
-            self.show_error(f"Error: {str(e)}", "Export Failed")
+        :param fixed: extra cells (g, p, d) the solver must leave as they are
+        :param banned: (period, day, activity) combinations the solver must not use
+        :param excluded: dict of (group, day) -> activities that group must not get that day
+        :return: list of human-readable problems (empty if the search can start)
+        """
+        with self._phase("prepare"):
+            return self._prepare_solver(fixed, banned, excluded)
 
-    def export_word(self):
-        matrix = self._matrix_or_template()
-        if matrix is None:
-            return
+    def _prepare_solver(self, fixed, banned, excluded):
+        if self.stats is not None and "search" in self.stats.phases:
+            self.stats.restarts += 1
+        self._fixed = set(fixed) | set(self.pins)
+        self._slot_used = {}
+        self._day_used = {}
+        self._uses = [{} for _ in self.matrix]
+        excluded = excluded or {}
+        issues = []
+        for g, group in enumerate(self.matrix):
+            for p, period in enumerate(group):
+                for d, activity in enumerate(period):
+                    used = self._slot_used.setdefault((p, d), set())
+                    day_used = self._day_used.setdefault((g, d), set())
+                    if not activity:
+                        continue
+                    if activity in used:
+                        issues.append(f"{activity} is given to more than one group in period {p + 1} on {DAYS[d]}")
+                    if activity in day_used:
+                        issues.append(f"Group {g + 1} has {activity} more than once on {DAYS[d]}")
+                    used.add(activity)
+                    day_used.add(activity)
+                    self._uses[g][activity] = self._uses[g].get(activity, 0) + 1
+        for g, uses in enumerate(self._uses):
+            for activity, count in uses.items():
+                if count > self.max_activity_uses:
+                    issues.append(f"Group {g + 1} has {activity} {count} times (limit {self.max_activity_uses})")
 
-        try:
-            make_word_doc_only(matrix, self.week_combo.currentText())
-            filepath = f"Generated Schedules/{self.week_combo.currentText()} Schedules.docx"
-            self.show_info(f"Exported Word document to {filepath}", "Word Export Complete")
-        except Exception as e:
-            self.show_error(f"Error: {str(e)}", "Word Export Failed")
+        self._domains = {}
+        for g, group in enumerate(self.matrix):
+            for p, period in enumerate(group):
+                for d, activity in enumerate(period):
+                    if activity or (g, p, d) in self._fixed:
+                        continue
+                    off = excluded.get((g, d), ())
+                    domain = [a for a in self.activities if (p, d, a) not in banned and a not in off and self.valid(a, (g, p, d))]
+                    if not domain:
+                        issues.append(f"No activity is left for Group {g + 1} in period {p + 1} on {DAYS[d]}")
+                    self._domains[g, p, d] = domain
+                    if self.stats is not None:
+                        self.stats.propagations += len(self.activities) - len(domain)
+        self._order = sorted(self._domains, key=lambda cell: (len(self._domains[cell]), cell))
+        self._filled = 0
+        return issues
 
-    def export_pie(self):
-        matrix = self._matrix_or_template()
-        if matrix is None:
-            return
+    def start_stats(self):
+        """
+        Start counting a new solver run, if `profile` is on or node hooks are set.
+
+        Counting wraps `valid`, `assign` and `unassign` on this instance only;
+        with profiling off the wrappers are removed and the search runs the
+        plain methods at full speed.
+
+        :return: the new SolveStats, or None
+        """
+        for name in ("valid", "assign", "unassign"):
+            self.__dict__.pop(name, None)
+        if not (self.profile or self.node_hooks):
+            self.stats = None
+            return None
 
+        stats = self.stats = SolveStats()
+        valid, assign, unassign = self.valid, self.assign, self.unassign
+        hooks = list(self.node_hooks)
+
+        def counted_valid(activity, pos):
+            stats.valid_calls += 1
+            return valid(activity, pos)
+
+        def counted_assign(pos, activity):
+            assign(pos, activity)
+            stats.nodes += 1
+            if self._filled > stats.max_depth:
+                stats.max_depth = self._filled
+            for hook in hooks:
+                hook(stats, pos, activity, self._filled)
+
+        def counted_unassign(pos):
+            unassign(pos)
+            stats.backtracks += 1
+
+        self.valid, self.assign, self.unassign = counted_valid, counted_assign, counted_unassign
+        return stats
+
+    def print_stats(self):
+        """Print the counters of the latest solver run (only when profiling)."""
+        if self.stats is not None:
+            print(f"Solver: {self.stats}")
+
+    def _phase(self, name):
+        return self.stats.phase(name) if self.stats is not None else contextlib.nullcontext()
+
+    def assign(self, pos, activity):
+        """Put an activity in the next free cell and update the solver state."""
+        g, p, d = pos
+        self.matrix[g][p][d] = activity
+        self._slot_used[p, d].add(activity)
+        self._day_used[g, d].add(activity)
+        self._uses[g][activity] = self._uses[g].get(activity, 0) + 1
+        self._filled += 1
+
+    def unassign(self, pos):
+        """Undo `assign` for a cell."""
+        g, p, d = pos
+        activity = self.matrix[g][p][d]
+        self.matrix[g][p][d] = ""
+        self._slot_used[p, d].discard(activity)
+        self._day_used[g, d].discard(activity)
+        self._uses[g][activity] -= 1
+        self._filled -= 1
+
+    def pin(self, group, period, day, activity):
+        """
+        Fix one cell before solving (0-based coordinates).
+
+        :param activity: activity name, or "" to keep the cell empty
+        """
+        self.pins[group, period, day] = activity
+
+    def unpin(self, group, period, day):
+        self.pins.pop((group, period, day), None)
+
+    def apply_pins(self):
+        """Write the pinned cells into the matrix; return issues for pins outside it."""
+        issues = []
+        for (g, p, d), activity in sorted(self.pins.items()):
+            if not (0 <= g < len(self.matrix) and 0 <= p < len(self.matrix[g]) and 0 <= d < len(self.matrix[g][p])):
+                # the day may not have a name: the pin is outside the matrix
+                day = DAYS[d] if 0 <= d < len(DAYS) else f"day {d + 1}"
+                issues.append(f"Pin for Group {g + 1}, period {p + 1} on {day} is outside the schedule")
+                continue
+            self.matrix[g][p][d] = activity
+        return issues
+
+    def repair_schedule(self, activity, days=None, periods=None, time_limit=1.0):
+        """
+        Take a cancelled activity out of the current schedule, changing as few cells as possible.
+
+        The cancelled assignments are cleared and the activity is banned from
+        the affected slots. Only a neighborhood of the schedule is then
+        re-solved, with every other cell kept fixed: first just the cleared
+        cells, then also the other groups' cells in the same slots, then the
+        affected groups' whole weeks, and finally everything but the pins.
+        In the first neighborhood that has a solution, a branch-and-bound
+        search (freed cells try their previous activity first) looks for the
+        one that changes the fewest cells until it is proven best or the time
+        is up.
+
+        :param activity: the cancelled activity
+        :param days: day indexes or names it is cancelled on (default: all)
+        :param periods: 0-based periods it is cancelled in (default: all)
+        :param time_limit: seconds for the whole repair
+        :return: (changed, issues): the changed cells (g, p, d), or None if no
+            repair was found (the schedule is then left unchanged), and the
+            problems that ruled a repair out (pins on the cancelled activity,
+            rules the week already breaks)
+        """
+        self.start_stats()
+        original = [[period[:] for period in group] for group in self.matrix]
+        num_periods = len(original[0]) if original else 0
+        num_days = len(original[0][0]) if num_periods else 0
+        days = range(num_days) if days is None else [day_index(d) for d in days]
+        periods = range(num_periods) if periods is None else periods
+        cells = [(g, p, d) for g in range(len(original)) for p in range(num_periods) for d in range(num_days)]
+
+        removed = {(g, p, d) for g, p, d in self.schedule_index().slots(activity) if p in periods and d in days}
+        issues = [
+            f"Group {g + 1}, period {p + 1} on {DAYS[d]} is pinned to {activity}"
+            for g, p, d in sorted(removed) if self.pins.get((g, p, d)) == activity
+        ]
+        if not issues:
+            # with every cell fixed, this only finds what the week already breaks
+            # (apart from the cancelled cells): no neighborhood could be solved
+            self.matrix = [[period[:] for period in group] for group in original]
+            for g, p, d in removed:
+                self.matrix[g][p][d] = ""
+            issues = self.prepare_solver(cells)
+            self.matrix = original
+        if issues:
+            return None, issues
+        banned = {(p, d, activity) for p in periods for d in days}
+        slots = {(p, d) for _, p, d in removed}
+        groups = {g for g, _, _ in removed}
+        neighborhoods = [
+            removed,
+            {cell for cell in cells if cell[1:] in slots},
+            {cell for cell in cells if cell[1:] in slots or cell[0] in groups},
+            set(cells),
+        ]
+
+        deadline = time.time() + time_limit
+        old_limit = self.time_limit
+        tried = []
         try:
-            activity_counts = {}
-            for group in matrix:
-                for period in group:
-                    for activity in period:
-                        if activity and activity != "":
-                            activity_counts[activity] = activity_counts.get(activity, 0) + 1
-
-            # If no activities are assigned in the matrix, fall back to the
-            # available `self.activities` so the user can export a pie chart
-            # showing available activities rather than requiring a generated schedule.
-            if not activity_counts:
-                if getattr(self, 'activities', None):
-                    activity_counts = {a: 1 for a in self.activities}
-                else:
-                    self.show_error("No activity data to plot", "Pie Export Failed")
-                    return
-
-            labels = list(activity_counts.keys())
-            sizes = list(activity_counts.values())
-            cmap = plt.get_cmap('tab20')
-            colors = [cmap(i % 20) for i in range(len(labels))]
-
-            fig, ax = plt.subplots(figsize=(8, 8))
-            explode = [0.04] * len(labels)
-            wedges, texts, autotexts = ax.pie(
-                sizes,
-                labels=labels,
-                autopct='%1.1f%%',
-                startangle=140,
-                colors=colors,
-                explode=explode,
-                pctdistance=0.77,
-                wedgeprops={'edgecolor': 'white', 'linewidth': 0.7}
-            )
-            ax.axis('equal')
-            plt.setp(autotexts, size=10, weight='bold', color='white')
-            plt.title(f'Activity Distribution - {self.week_combo.currentText()}')
-            filepath = f"Generated Schedules/{self.week_combo.currentText()}_pie.png"
-            os.makedirs("Generated Schedules", exist_ok=True)
-            plt.tight_layout()
-            plt.savefig(filepath, dpi=150)
-            plt.close()
-
-            self.show_info(f"Pie chart saved to {filepath}", "Pie Export Complete")
-        except Exception as e:
-            self.show_error(f"Error: {str(e)}", "Pie Export Failed")
+            for i, neighborhood in enumerate(neighborhoods):
+                free = {cell for cell in neighborhood if cell not in self.pins} | removed
+                if free in tried or time.time() >= deadline:
+                    continue
+                tried.append(free)
+
+                self.matrix = [[period[:] for period in group] for group in original]
+                for g, p, d in free:
+                    self.matrix[g][p][d] = ""
+                if self.prepare_solver(set(cells) - free, banned):
+                    continue
+                # a neighborhood without any solution may not use up the time of the larger ones
+                self.start_time = time.time()
+                self.time_limit = deadline - self.start_time
+                if i < len(neighborhoods) - 1:
+                    self.time_limit /= 2
+                # removed cells change whatever they get: a lower bound for the rest of the order
+                forced = [0] * (len(self._order) + 1)
+                for k in range(len(self._order) - 1, -1, -1):
+                    forced[k] = forced[k + 1] + (self._order[k] in removed)
+                self._best = (len(free) + 1, None)
+                with self._phase("search"):
+                    self._repair_search(original, forced, 0)
+                if self._best[1] is not None:
+                    self.matrix = self._best[1]
+                    return [(g, p, d) for g, p, d in cells if self.matrix[g][p][d] != original[g][p][d]], []
+        finally:
+            self.time_limit = old_limit
+
+        self.matrix = original
+        return None, []
+
+    def _repair_search(self, original, forced, changes):
+        """
+        Branch and bound over the free cells, keeping the schedule with the fewest
+        changes from `original` in `self._best` as (changes, matrix).
+
+        :return: True to stop (best possible found, or out of time)
+        """
+        if time.time() - self.start_time > self.time_limit:
+            return True
+
+        find = self.find_empty()
+        if not find:
+            self._best = (changes, [[period[:] for period in group] for group in self.matrix])
+            return changes == forced[0]
+
+        g, p, d = find
+        keep = original[g][p][d]
+        choices = self._domains[find][:]
+        self.rng.shuffle(choices)
+        if keep in choices:
+            choices.remove(keep)
+            choices.insert(0, keep)
+        for activity in choices:
+            cost = changes + (activity != keep)
+            if cost + forced[self._filled + 1] >= self._best[0]:
+                continue
+            if self.valid(activity, find):
+                self.assign(find, activity)
+                stop = self._repair_search(original, forced, cost)
+                self.unassign(find)
+                if stop:
+                    return True
+        return False
+
+    def start_weekly_solve(self, num_groups, seed=None):
+        """Blank matrix with the pins applied, ready for `solve()`; returns issues found."""
+        if seed is not None:
+            self.rng.seed(seed)
+        self.matrix = self.generate_weekly_matrix(num_groups)
+        issues = self.apply_pins()
+        issues += self.prepare_solver()
+        self.start_time = time.time()
+        return issues
     
-    def export_csv(self):
-        matrix = self._matrix_or_template()
-        if matrix is None:
-            return
+    def solve_week(self, num_groups, seed=None):
+        """
+        Solve a whole week.
 
-        try:
-            filepath = f"Generated Schedules/{self.week_combo.currentText()}_schedule.csv"
-            os.makedirs("Generated Schedules", exist_ok=True)
-            with open(filepath, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(["Group", "Period", "Days"])
+        With a seed the search is reproducible, and the result is kept in the
+        solver cache (store.SolveCache) under a hash of the settings and the
+        seed, so solving the same week again returns it without searching.
 
-                for g, group in enumerate(matrix):
-                    for p, period in enumerate(group):
-                        writer.writerow([f"Group {g+1}", f"Period {p+1}"] + period)
+        :param seed: int, or None for an unseeded, uncached solve
+        :return: (SolveResult, pin issues that prevented solving, whether the result came from the cache)
+        """
+        self.start_stats()
+        if seed is None:
+            issues = self.start_weekly_solve(num_groups)
+            return self.solve() if not issues else SolveResult(False, self.stats), issues, False
 
-            self.show_info(f"Exported to {filepath}", "CSV Export Complete")
-        except Exception as e:
-            self.show_error(f"Error: {str(e)}", "CSV Export Failed")
+        from store import SolveCache, solve_key
+        key = solve_key(self.solve_settings(num_groups, seed))
+        with SolveCache() as cache:
+            matrix = cache.get(key)
+            if matrix is not None:
+                self.matrix = matrix
+                return SolveResult(True, self.stats), [], True
+            issues = self.start_weekly_solve(num_groups, seed)
+            if issues:
+                return SolveResult(False, self.stats), issues, False
+            solved = self.solve()
+            if solved:
+                cache.put(key, self.matrix)
+            return solved, [], False
+
+    def solve_settings(self, num_groups, seed):
+        """Everything that decides the outcome of a seeded weekly solve, as a JSON-serializable dict."""
+        return {
+            "solver": SOLVER_VERSION,
+            "activities": list(self.activities),
+            "groups": num_groups,
+            "periods": self.periods_spin.value(),
+            "days": len(DAYS),
+            "max_activity_uses": self.max_activity_uses,
+            "pins": sorted([*cell, activity] for cell, activity in self.pins.items()),
+            "seed": seed,
+        }
+
+    def export_json(self):
+        self._export_format("JSON", "Exported to {}", "Export")
+
+    def export_word(self):
+        self._export_format("Word", "Exported Word document to {}", "Word Export")
+
+    def export_pie(self):
+        # with no assignments yet, the pie falls back to the configured activities
+        self._export_format("Pie", "Pie chart saved to {}", "Pie Export")
+    
+    def export_csv(self):
+        self._export_format("CSV", "Exported to {}", "CSV Export")
     
     def export_image(self):
+        self._export_format("Image", "Image saved to {}", "Image Export")
+
+    def season(self):
+        """Season (camp, year, ...) the current week is stored under."""
+        return self.season_edit.text().strip()
+
+    def _export_format(self, stage, message, title):
+        """Write one export format through the shared word.py writers."""
         matrix = self._matrix_or_template()
         if matrix is None:
             return
 
         try:
-            img = Image.new('RGB', (1000, 600 + len(matrix) * 100), color='white')
-            draw = ImageDraw.Draw(img)
-
-            y_pos = 20
-            for g, group in enumerate(matrix):
-                text = f"Group {g+1}: {' | '.join([str(period) for period in group])}"
-                draw.text((20, y_pos), text, fill='black')
-                y_pos += 100
-
-            filepath = f"Generated Schedules/{self.week_combo.currentText()}_schedule.png"
-            os.makedirs("Generated Schedules", exist_ok=True)
-            img.save(filepath)
-
-            self.show_info(f"Image saved to {filepath}", "Image Export Complete")
+            export = ScheduleExport(matrix, self.week_combo.currentText(), self.activities, self.season())
+            files = export_stage(export, stage)
+            self.show_info(message.format(", ".join(files)), f"{title} Complete")
         except Exception as e:
-            self.show_error(f"Error: {str(e)}", "Image Export Failed")
+            self.show_error(f"Error: {str(e)}", f"{title} Failed")
     
     def analyze(self):
         matrix = self._matrix_or_template()
@@ -584,16 +1257,13 @@ class Ui_MainWindow(object):
             return
 
         try:
-            activity_counts = {}
-            for group in matrix:
-                for period in group:
-                    for activity in period:
-                        if activity:
-                            activity_counts[activity] = activity_counts.get(activity, 0) + 1
-            
-            counts = np.array(list(activity_counts.values()))
-            total_unique = len(activity_counts)
-            total_assign = int(np.sum(counts)) if counts.size > 0 else 0
+            import numpy as np
+            from analysis import schedule_metrics, schedule_stats, validate_schedule
+
+            stats = schedule_stats(matrix)
+            counts = stats.totals[stats.totals > 0]
+            total_unique = int(counts.size)
+            total_assign = stats.total_assignments
             avg_freq = float(np.mean(counts)) if counts.size > 0 else 0.0
             std_dev = float(np.std(counts)) if counts.size > 0 else 0.0
 
@@ -605,10 +1275,66 @@ class Ui_MainWindow(object):
                 "Std Deviation: {:.2f}".format(total_unique, total_assign, avg_freq, std_dev)
             )
 
+            metrics = schedule_metrics(matrix)
+            if metrics and total_assign:
+                msg += (
+                    "\n\nDiversity: {:.1f} distinct activities per group (min {}), entropy {:.2f} bits\n"
+                    "Fairness: Gini {:.2f} (0 = equal exposure), max spread {} uses\n"
+                    "Repeats: {} days apart on average (closest {}), morning share {:.0%}".format(
+                        float(np.mean(metrics["distinct"])), min(metrics["distinct"]),
+                        float(np.mean(metrics["entropy"])),
+                        metrics["mean_gini"], metrics["max_spread"],
+                        "n/a" if np.isnan(metrics["mean_gap"]) else "{:.1f}".format(metrics["mean_gap"]),
+                        "n/a" if np.isnan(metrics["min_gap"]) else "{:.0f}".format(metrics["min_gap"]),
+                        float(np.mean(metrics["morning_share"])),
+                    )
+                )
+
+            violations = validate_schedule(matrix, self.max_activity_uses)
+            errors = [v for v in violations if v["severity"] == "error"]
+            warnings = [v for v in violations if v["severity"] == "warning"]
+            msg += "\n\nRule Violations: {} errors, {} warnings".format(len(errors), len(warnings))
+            for v in (errors + warnings)[:10]:
+                msg += f"\n- {v['message']}"
+            if len(violations) > 10:
+                msg += f"\n... and {len(violations) - 10} more"
+
             self.show_info(msg, "Schedule Analysis")
         except Exception as e:
             self.show_error(f"Error: {str(e)}", "Analysis Failed")
 
+    def load_schedule(self):
+        """Load an exported schedule file as the current matrix."""
+        filepath, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self.main_window, "Load Schedule", "Generated Schedules",
+            "Schedules (*.json *.csv *.docx)")
+        if not filepath:
+            return
+
+        try:
+            matrix = load_schedule(filepath, self.periods_spin.value(), 4)
+        except Exception as e:
+            self.show_error(f"Could not load {filepath}:\n{str(e)}", "Load Failed")
+            return
+
+        # keep the members of groups that are still there
+        self.groups = {f"Group {g+1}": self.groups.get(f"Group {g+1}", []) for g in range(len(matrix))}
+        self.matrix = matrix
+        self.update_group_display()
+        self.show_info(f"Loaded {len(matrix)} groups from {filepath}", "Schedule Loaded")
+
+    def schedule_index(self):
+        """Lookup indexes over the current schedule (None if there is none).
+
+        Built on first use and rebuilt only when the matrix is replaced; edit
+        cells through the returned index's `set` to keep it current.
+        """
+        if self.matrix is None:
+            return None
+        if self._index is None or self._index.matrix is not self.matrix:
+            self._index = ScheduleIndex(self.matrix)
+        return self._index
+
     def _matrix_or_template(self):
         """Return the current matrix or build a blank template from current groups/periods.
 
@@ -625,29 +1351,16 @@ class Ui_MainWindow(object):
         # build a blank weekly matrix using current periods setting
         return self.generate_weekly_matrix(num_groups)
 
-    # Daily mode removed: no get_time_label or update_time_selector
     
-    def try_auto_adjust_and_solve(self, num_groups):
+    def try_auto_adjust_and_solve(self, num_groups, seed=None):
         """
         Attempt to auto-adjust max_activity_uses to meet capacity requirements,
         then retry solving. Returns True if successful, False otherwise.
         """
-        num_activities = len(self.activities)
-        num_periods = self.periods_spin.value()
-        slots_per_group = num_periods * 4
-        
-        # calculate minimum uses per activity needed to fill slots
-        min_uses = (slots_per_group + num_activities - 1) // num_activities  # ceiling division
-        
-        if min_uses > self.max_activity_uses:
-            old_limit = self.max_activity_uses
-            self.max_activity_uses = min_uses
-            print(f"Auto-adjusted activity limit from {old_limit} to {self.max_activity_uses}")
-            
+        old_limit = self.adjust_activity_limit(num_groups)
+        if old_limit is not None:
             # rebuild matrix with new limit and retry solve
-            self.matrix = self.generate_weekly_matrix(num_groups)
-            self.start_time = time.time()
-            if self.solve():
+            if self.solve_week(num_groups, seed)[0]:
                 return True
             else:
                 # revert if it still fails
@@ -655,6 +1368,27 @@ class Ui_MainWindow(object):
                 return False
         
         return False
+
+    def adjust_activity_limit(self, num_groups):
+        """
+        Raise max_activity_uses to the fewest uses per activity that can
+        fill a group's week.
+
+        :return: the old limit if it was raised, else None
+        """
+        num_activities = len(self.activities)
+        num_periods = self.periods_spin.value()
+        slots_per_group = num_periods * 4
+        
+        # calculate minimum uses per activity needed to fill slots
+        min_uses = (slots_per_group + num_activities - 1) // num_activities  # ceiling division
+        
+        if min_uses <= self.max_activity_uses:
+            return None
+        old_limit = self.max_activity_uses
+        self.max_activity_uses = min_uses
+        print(f"Auto-adjusted activity limit from {old_limit} to {self.max_activity_uses}")
+        return old_limit
     
     def show_error(self, text, title):
         msg = QMessageBox()
@@ -698,6 +1432,13 @@ class Ui_MainWindow(object):
                 f"Too few distinct activities for simultaneous slots: {num_activities} activities < {num_groups} groups (requires at least one distinct activity per group per timeslot)"
             )
 
+        # a group does an activity at most once a day => need a distinct activity for every period
+        num_periods = self.periods_spin.value()
+        if num_activities < num_periods:
+            issues.append(
+                f"Too few distinct activities for one day: {num_activities} activities < {num_periods} periods (a group cannot repeat an activity on the same day)"
+            )
+
         # warn if any group has no participants
         empty_groups = [g for g, members in self.groups.items() if not members]
         if empty_groups:
@@ -712,5 +1453,7 @@ if __name__ == "__main__":
     MainWindow = QtWidgets.QMainWindow()
     ui = Ui_MainWindow()
     ui.setupUi(MainWindow)
+    # print solver counters after each generation
+    ui.profile = "--profile" in sys.argv
     MainWindow.show()
     sys.exit(app.exec_())
\ No newline at end of file
@@ -1,20 +1,42 @@
 
 # Export and visualization helpers:
-# - `docx` + `docx.shared.Pt`: build .docx schedule documents from a template
 # - `deepcopy`: used to duplicate document table structures when creating group tables
-# - `numpy` and `matplotlib`: simple numeric aggregation and visualization (bar charts)
-# - `PIL.Image*` and `cv2`: create and manipulate schedule images (Pillow preferred for simple drawing)
 # - `json`/`csv`/`os`: write schedule exports and manage filesystem
-import docx
+# - `threading`: guards the shared in-memory template cache
+# - `zipfile`/`io`/`re`/`contextlib`/`xml.sax.saxutils.escape`: stream
+#   WordprocessingML straight into the .docx zip for very large exports
+# - `concurrent.futures`/`multiprocessing`/`itertools`/`time`: render group
+#   fragments in a process pool and run the export stages concurrently with
+#   per-stage timings (pools use "spawn": the UI process runs threads)
+# - `hashlib`: content hashes of export inputs, to skip regenerating unchanged files
+# - `functools`: caches the schedule image font and cell tiles
+# - `days.DAYS`: day labels of the weekly matrix
+# The heavy dependencies are imported by the functions that use them, so
+# importing this module (and starting the UI) stays fast:
+# - `docx` + `lxml.etree`: build .docx schedule documents from a template
+# - `matplotlib` (Agg `Figure`s, no pyplot): bar and pie charts
+# - `PIL.Image*`: schedule grid images
+# - `analysis.schedule_stats` (NumPy): shared, cached activity counts for charts
+# - `store` (sqlite3, NumPy): the season's schedule store and binary archive,
+#   written by the "Store" and "Archive" stages
 from copy import deepcopy
-from docx.shared import Pt 
-import numpy as np
-import matplotlib.pyplot as plt
-from PIL import Image, ImageDraw, ImageFont
-import cv2
 import json
 import csv
 import os
+import threading
+import zipfile
+import io
+import re
+import contextlib
+from xml.sax.saxutils import escape
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import itertools
+import time
+import hashlib
+import functools
+from days import DAYS
 
 
 GAMES = ["name games","softball", "basketball", "squash", "ultimate", "hockey", "lacrosse", "football", "tennis", "volleyball", "soccer"]
@@ -22,6 +44,63 @@ GAMES = ["name games","softball", "basketball", "squash", "ultimate", "hockey",
 # maximum number of periods per group
 MAX_PERIODS = 6
 
+# Word template holding the pre-formatted Group 1 table
+TEMPLATE_PATH = "2019 Template Schedules.docx"
+
+# exports with at least this many groups are streamed instead of built with python-docx
+STREAM_MIN_GROUPS = 20
+
+# below this many groups, rendering Word fragments in-process is faster than
+# starting a process pool (about 0.5ms per group against the pool's start-up)
+PARALLEL_MIN_GROUPS = 200
+
+# JSON layouts understood by `write_json`
+JSON_MODES = ("pretty", "compact", "ndjson", "ndjson-week")
+
+# record of the input hash each generated file was written from
+MANIFEST_PATH = "Generated Schedules/.export_manifest.json"
+
+# bump when a writer's output changes, so existing files are regenerated
+EXPORT_VERSION = 1
+
+# parsed templates kept for the life of the process:
+# path -> (mtime, document, cell map of the Group 1 table)
+_template_cache = {}
+_template_lock = threading.Lock()
+
+# streaming skeletons: (path, mtime, periods, days) -> _StreamSkeleton
+_skeleton_cache = {}
+
+# unique suffixes of the temporary files behind atomic saves
+_temp_names = itertools.count()
+
+# process pool of the chart stages, started on first use (see `_chart_pool`)
+_chart_executor = None
+_chart_executor_lock = threading.Lock()
+
+# one ChartRenderer per thread (see `chart_renderer`)
+_chart_renderers = threading.local()
+
+# schedule image layout (pixels) and colors
+IMAGE_GROUPS_PER_PAGE = 10
+IMAGE_PALETTE = ["#aec7e8", "#ffbb78", "#98df8a", "#ff9896", "#c5b0d5", "#c49c94", "#f7b6d2", "#dbdb8d",
+	"#9edae5", "#fdd0a2", "#c7e9c0", "#dadaeb", "#fcbba1", "#c6dbef", "#e5d8bd", "#d9d9d9"]
+_IMAGE_MARGIN = 30
+_IMAGE_HEADING_HEIGHT = 40
+_IMAGE_LABEL_WIDTH = 110
+_IMAGE_CELL_WIDTH = 170
+_IMAGE_CELL_HEIGHT = 36
+_IMAGE_HEADER_FILL = "#eeeeee"
+_IMAGE_GRID_COLOR = "#808080"
+
+# placeholders written into the skeleton document and replaced while streaming
+_GROUP_MARK = "\ue000"
+_STYLE_MARK = "\ue001"
+_TEXT_MARK = "\ue002"
+_UNIT_MARK = "unit"
+_TEXT_RUN = "<w:r><w:t>" + _TEXT_MARK + "</w:t></w:r>"
+_TOKEN_RE = re.compile("(" + _GROUP_MARK + "|" + _STYLE_MARK + "|" + re.escape(_TEXT_RUN) + ")")
+
 
 def cap_periods(matrix, max_periods=MAX_PERIODS):
 	"""
@@ -34,6 +113,84 @@ def cap_periods(matrix, max_periods=MAX_PERIODS):
 		capped.append(group[:max_periods])
 	return capped
 
+def load_template(path=TEMPLATE_PATH):
+	"""
+	Return a fresh copy of the Word template, ready to add tables to.
+
+	The template is parsed once per process into a pristine in-memory
+	document (with the Normal style already set to Arial 12). Each call
+	returns a deep copy of it, which is cheaper than unzipping and parsing
+	the file again. The cached copy is replaced when the file's
+	modification time changes.
+
+	:param path: str
+	:return: docx Document
+	"""
+	from docx.document import Document
+
+	with _template_lock:
+		# copy the document part (and through it the whole package) rather than
+		# the Document proxy: lxml elements ignore deepcopy's memo, so copying
+		# the proxy would leave it pointing at a different tree than the part
+		part = deepcopy(_cached_template(path)[1].part)
+		return Document(part.element, part)
+
+
+def template_cell_map(path=TEMPLATE_PATH):
+	"""
+	Return the fillable-cell map of the template's Group 1 table.
+
+	:param path: str
+	:return: list (see `map_fillable_cells`)
+	"""
+	with _template_lock:
+		return _cached_template(path)[2]
+
+
+def _cached_template(path):
+	"""Return the (mtime, document, cell map) cache entry, reloading it if stale."""
+	mtime = os.stat(path).st_mtime_ns
+	cached = _template_cache.get(path)
+	if cached is None or cached[0] != mtime:
+		import docx
+		from docx.shared import Pt
+
+		doc = docx.Document(path)
+		font = doc.styles['Normal'].font
+		font.name = 'Arial'
+		font.size = Pt(12)
+		cached = (mtime, doc, map_fillable_cells(doc.tables[0]))
+		_template_cache[path] = cached
+	return cached
+
+
+def map_fillable_cells(table):
+	"""
+	Find the cells of a blank schedule table that take activities.
+
+	A cell is fillable when it is empty or holds the "Name Games"
+	placeholder; continuation cells of vertical merges are skipped.
+	Every row with fillable cells is one period, in order.
+
+	:param table: docx Table (an unfilled copy of the template table)
+	:return: list with one entry per period: list of (row index, cell index)
+	"""
+	from docx.table import _Cell
+
+	cell_map = []
+	for r, tr in enumerate(table._tbl.tr_lst):
+		cells = []
+		for c, tc in enumerate(tr.tc_lst):
+			if tc.vMerge == "continue":
+				continue
+			text = _Cell(tc, table).text
+			if text == "" or text.lower().strip() == "name games":
+				cells.append((r, c))
+		if cells:
+			cell_map.append(cells)
+	return cell_map
+
+
 def create_tables(n, doc):
 	"""
 	will create all of the neccessary tables/schdules for
@@ -56,67 +213,775 @@ def create_tables(n, doc):
 			doc.add_page_break()
 
 
-def fill_tables(matrix, doc):
+def fill_tables(matrix, doc, cell_map=None):
 	"""
-	fills in the tables previously created by the create_tables function:
-	
+	fills in the tables previously created by the create_tables function.
+
+	Cells are written straight from a precomputed map of fillable cells,
+	so the work is linear in the number of schedule cells. Periods or days
+	beyond what the table has room for are left out.
+
 	:param matrix: a 3d list
 	:param doc: the word document
+	:param cell_map: fillable cells of one table (see `map_fillable_cells`);
+		computed from the first table when not given
+	:return: None
+	"""
+	from docx.table import _Cell
+
+	tables = doc.tables
+	if cell_map is None:
+		cell_map = map_fillable_cells(tables[0])
+	name_style = doc.styles['name']
+	center_style = doc.styles['center']
+
+	for group, table in zip(matrix, tables):
+		rows = table._tbl.tr_lst
+		for period, cells in zip(group, cell_map):
+			for activity, (r, c) in zip(period, cells):
+				cell = _Cell(rows[r].tc_lst[c], table)
+				cell.text = activity
+				if activity == "Name Games":
+					cell.paragraphs[0].style = name_style
+				else:
+					cell.paragraphs[0].style = center_style
+
+
+def build_word_doc(matrix):
+	"""
+	Create and fill the schedule document in memory.
+
+	:param matrix: 3d list (already capped to MAX_PERIODS)
+	:return: docx Document
+	"""
+	doc = load_template()
+	# The template already contains the table and header for Group 1.
+	create_tables(len(matrix) - 1, doc)
+	fill_tables(matrix, doc, template_cell_map())
+	return doc
+
+
+def save_document(doc, filepath):
+	"""
+	Save a document atomically: the file is written next to its target and
+	renamed over it, so a failed export never leaves a half-written .docx.
+
+	:param doc: docx Document
+	:param filepath: str
+	:return: None
+	"""
+	with _atomic_output(filepath) as f:
+		doc.save(f)
+
+
+@contextlib.contextmanager
+def _atomic_output(filepath):
+	"""Yield a binary file that replaces `filepath` only once it is fully written."""
+	folder = os.path.dirname(filepath) or "."
+	os.makedirs(folder, exist_ok=True)
+	tmp_path = os.path.join(folder, f".{os.path.basename(filepath)}.{os.getpid()}-{next(_temp_names)}.tmp")
+	# created with open() rather than tempfile.mkstemp, so the file gets the
+	# umask's permissions like a plain save instead of mkstemp's 0600;
+	# "x" never opens another writer's temporary file
+	f = open(tmp_path, "xb")
+	try:
+		with f:
+			yield f
+		os.replace(tmp_path, filepath)
+	except BaseException:
+		os.remove(tmp_path)
+		raise
+
+
+def write_word_doc(matrix, filepath, workers=None, groups_per_file=None, manifest=None):
+	"""
+	Write the filled schedule document, streaming it for large group counts.
+
+	:param matrix: 3d list (already capped to MAX_PERIODS)
+	:param filepath: str
+	:param workers: render groups in a pool of this many processes
+	:param groups_per_file: split the output into files of this many groups
+	:param manifest: ExportManifest; files whose groups are unchanged are skipped
+	:return: list of output file paths, including skipped ones
+	"""
+	rectangular = _is_rectangular(matrix)
+	if groups_per_file and not rectangular:
+		raise ValueError("Splitting a Word export needs the same number of periods and days for every group")
+	if (workers or groups_per_file) and rectangular:
+		return write_word_doc_parallel(matrix, filepath, workers, groups_per_file, manifest=manifest)
+
+	if manifest is not None:
+		digest = word_digest(matrix)
+		if manifest.is_current(filepath, digest):
+			return [filepath]
+	if len(matrix) >= STREAM_MIN_GROUPS and rectangular:
+		write_word_doc_streaming(matrix, filepath)
+	else:
+		save_document(build_word_doc(matrix), filepath)
+	if manifest is not None:
+		manifest.record(filepath, digest)
+	return [filepath]
+
+
+def write_word_doc_streaming(matrix, filepath, path=TEMPLATE_PATH):
+	"""
+	Write the schedule document by streaming WordprocessingML into the zip.
+
+	Instead of deep-copying the Group 1 table per group into a python-docx
+	tree, the template is rendered once into a skeleton whose table, group
+	heading and page break markup are split into text fragments around
+	placeholders. Each group's fragment is filled and written straight into
+	word/document.xml, so memory stays flat however many groups there are.
+	The XML is the same as `build_word_doc()` produces.
+
+	:param matrix: 3d list with the same number of periods/days in every group
+	:param filepath: str
+	:param path: template path
 	:return: None
 	"""
-	for group, line in enumerate(doc.tables):
-		r = 0
-		for row in line.rows:
-			col = 0
-			update = False
-			for cell in row.cells:
-				if cell.text == "" or cell.text.lower().strip() == "name games":
-					try:
-						cell.text = matrix[group][r][col]
-						if cell.text == "Name Games":
-							cell.paragraphs[0].style = 'name'
-						else:
-							cell.paragraphs[0].style = 'center'
-						col += 1
-						update = True
-					except:
-						break
-			if update:
-				r += 1
-
-
-def make_word_doc(matrix, file_name="Week 1"):
-	"""
-	creates the word document that contains the new schdule.
+	skeleton = _skeleton_for(matrix, path)
+	fragments = (
+		render_group_fragment(skeleton.tokens(g, len(matrix)), g + 1, skeleton.group_values(group), skeleton.style_ids)
+		for g, group in enumerate(matrix)
+	)
+	_write_streamed(filepath, skeleton, fragments)
+
+
+def write_word_doc_parallel(matrix, filepath, workers=None, groups_per_file=None, path=TEMPLATE_PATH, manifest=None):
+	"""
+	Render each group's document fragment in a process pool and merge them.
+
+	Fragments come back in group order and are streamed into the output as
+	they arrive. Fewer than PARALLEL_MIN_GROUPS groups are rendered in-process,
+	where the pool would cost more than it saves. With `groups_per_file` the schedule is split into several
+	documents named "<name> (Groups 1-10).docx", "<name> (Groups 11-20).docx", ...
+	When a manifest is given, only the files whose groups changed are rendered.
+
+	:param matrix: 3d list with the same number of periods/days in every group
+	:param filepath: str, the output path (used as the base name when splitting)
+	:param workers: number of worker processes (default: CPU count); 1 renders in-process
+	:param groups_per_file: int or None
+	:param path: template path
+	:param manifest: ExportManifest or None
+	:return: list of output file paths, including skipped ones
+	"""
+	skeleton = _skeleton_for(matrix, path)
+	size = groups_per_file or len(matrix)
+	base, ext = os.path.splitext(filepath)
+	parts = []
+	for start in range(0, len(matrix), size):
+		count = len(matrix[start:start + size])
+		part_path = filepath if size >= len(matrix) else f"{base} (Groups {start + 1}-{start + count}){ext}"
+		parts.append((start, count, part_path))
+	paths = [part_path for _, _, part_path in parts]
+
+	if manifest is not None:
+		digests = {part_path: word_digest(matrix[start:start + count], start, path) for start, count, part_path in parts}
+		parts = [part for part in parts if not manifest.is_current(part[2], digests[part[2]])]
+		if not parts:
+			return paths
+
+	jobs = []
+	for start, count, _ in parts:
+		for i in range(count):
+			group = matrix[start + i]
+			jobs.append((skeleton.position(i, count), start + i + 1, skeleton.group_values(group)))
+
+	workers = workers or os.cpu_count() or 1
+	if workers == 1 or len(jobs) < PARALLEL_MIN_GROUPS:
+		_init_fragment_worker(skeleton.fragments(), skeleton.style_ids)
+		_write_parts(skeleton, parts, map(_render_job, jobs))
+	else:
+		with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"), initializer=_init_fragment_worker, initargs=(skeleton.fragments(), skeleton.style_ids)) as pool:
+			chunksize = max(1, len(jobs) // (workers * 4))
+			_write_parts(skeleton, parts, pool.map(_render_job, jobs, chunksize=chunksize))
+
+	if manifest is not None:
+		for _, _, part_path in parts:
+			manifest.record(part_path, digests[part_path])
+	return paths
+
+
+def _write_parts(skeleton, parts, fragments):
+	"""Stream consecutive fragments into one file per (start, count, path) part."""
+	fragments = iter(fragments)
+	for _, count, part_path in parts:
+		_write_streamed(part_path, skeleton, itertools.islice(fragments, count))
+
+
+# skeleton fragments and style ids, set once per worker process
+_worker_fragments = None
+
+
+def _init_fragment_worker(fragments, style_ids):
+	global _worker_fragments
+	_worker_fragments = (fragments, style_ids)
+
+
+def _render_job(job):
+	"""Render one (position, group number, values) job with the worker's skeleton."""
+	position, number, values = job
+	fragments, style_ids = _worker_fragments
+	return render_group_fragment(fragments[position], number, values, style_ids)
+
+
+def _skeleton_for(matrix, path):
+	"""Return the streaming skeleton matching the shape of `matrix`."""
+	if not _is_rectangular(matrix):
+		raise ValueError("Streaming export needs the same number of periods and days for every group")
+	periods = len(matrix[0])
+	days = len(matrix[0][0]) if periods else 0
+	return _stream_skeleton(path, periods, days)
+
+
+def _write_streamed(filepath, skeleton, fragments):
+	"""Write a .docx whose main document is the head/group fragments plus the tail."""
+	with _atomic_output(filepath) as f:
+		with zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED) as out:
+			for info, data in skeleton.entries:
+				if data is not None:
+					out.writestr(info, data)
+					continue
+				with out.open(info, "w") as stream:
+					for chunk in fragments:
+						stream.write(chunk.encode("utf-8"))
+					stream.write("".join(skeleton.tail).encode("utf-8"))
+
+
+def _is_rectangular(matrix):
+	"""True if every group has the same number of periods and every period the same number of days."""
+	if not matrix:
+		return False
+	periods = len(matrix[0])
+	days = len(matrix[0][0]) if periods else 0
+	return all(len(group) == periods and all(len(period) == days for period in group) for group in matrix)
+
+
+class _StreamSkeleton:
+	"""
+	Pre-rendered pieces of a schedule document for streaming.
+
+	`entries` lists the zip members in order as (ZipInfo, bytes); the main
+	document has bytes None and is streamed from the fragments. The document XML
+	is kept as token lists for the head (up to and including Group 1), a
+	group unit followed by a page break, the final group unit, and the tail.
+	"""
+
+	def __init__(self, entries, head, unit, last, tail, style_ids, cells):
+		self.entries = entries
+		self.head = head
+		self.unit = unit
+		self.last = last
+		self.tail = tail
+		self.style_ids = style_ids
+		self.cells = cells
+
+	def position(self, index, count):
+		"""Fragment to use for the `index`-th of `count` groups in one document: 0 head, 1 unit, 2 last."""
+		if index == 0:
+			return 0
+		return 2 if index == count - 1 else 1
+
+	def fragments(self):
+		return (self.head, self.unit, self.last)
+
+	def tokens(self, index, count):
+		return self.fragments()[self.position(index, count)]
+
+	def group_values(self, group):
+		"""Activities of one group in document (row-major) order."""
+		return [group[p][d] for p, d in self.cells]
+
+
+def render_group_fragment(tokens, group_number, values, style_ids):
+	"""
+	Fill one skeleton fragment with a group's number and activities.
+
+	:param tokens: fragment split around the placeholders
+	:param group_number: int, 1-based
+	:param values: the group's activities in document order
+	:param style_ids: (center style id, name style id)
+	:return: str
+	"""
+	center_id, name_id = style_ids
+	values = iter(values)
+	value = ""
+	out = []
+	for token in tokens:
+		if token == _GROUP_MARK:
+			out.append(str(group_number))
+		elif token == _STYLE_MARK:
+			value = next(values)
+			out.append(name_id if value == "Name Games" else center_id)
+		elif token == _TEXT_RUN:
+			out.append(_run_xml(value))
+		else:
+			out.append(token)
+	return "".join(out)
+
+
+def _run_xml(text):
+	"""Run markup for a cell value, matching what python-docx writes for `cell.text`."""
+	if not text:
+		return "<w:r/>"
+	if text != text.strip():
+		return '<w:r><w:t xml:space="preserve">' + escape(text) + "</w:t></w:r>"
+	return "<w:r><w:t>" + escape(text) + "</w:t></w:r>"
+
+
+def _stream_skeleton(path, periods, days):
+	"""Return the cached streaming skeleton for a template and schedule shape."""
+	key = (path, os.stat(path).st_mtime_ns, periods, days)
+	with _template_lock:
+		skeleton = _skeleton_cache.get(key)
+	if skeleton is None:
+		skeleton = _build_skeleton(path, periods, days)
+		with _template_lock:
+			_skeleton_cache[key] = skeleton
+	return skeleton
+
+
+def _build_skeleton(path, periods, days):
+	"""
+	Render a three-group document with placeholders and cut it into fragments.
+
+	:param path: template path
+	:param periods: periods per group
+	:param days: days per period
+	:return: _StreamSkeleton
+	"""
+	from docx.table import _Cell
+	from lxml import etree
+
+	doc = load_template(path)
+	cell_map = template_cell_map(path)
+	create_tables(2, doc)
+	center_style = doc.styles['center']
+
+	cells = []
+	for p, row_cells in enumerate(cell_map[:periods]):
+		for d in range(min(days, len(row_cells))):
+			cells.append((p, d))
+	for table in doc.tables:
+		rows = table._tbl.tr_lst
+		for p, d in cells:
+			r, c = cell_map[p][d]
+			cell = _Cell(rows[r].tc_lst[c], table)
+			cell.text = _TEXT_MARK
+			paragraph = cell.paragraphs[0]
+			paragraph.style = center_style
+			paragraph._p.pPr.pStyle.val = _STYLE_MARK
+
+	# group headings: the template's "Group 1" and the added "Group 2"/"Group 3"
+	headings = {}
+	for paragraph in doc.paragraphs:
+		if paragraph.text in ("Group 1", "Group 2", "Group 3") and paragraph.text not in headings:
+			headings[paragraph.text] = paragraph
+	for paragraph in headings.values():
+		run = paragraph.runs[-1]
+		run.text = run.text[:-1] + _GROUP_MARK
+
+	body = doc.element.body
+	headings["Group 2"]._p.addprevious(etree.Comment(_UNIT_MARK))
+	headings["Group 3"]._p.addprevious(etree.Comment(_UNIT_MARK))
+	body.sectPr.addprevious(etree.Comment(_UNIT_MARK))
+	xml = doc.part.blob.decode("utf-8")
+	head, unit, last, tail = xml.split("<!--" + _UNIT_MARK + "-->")
+
+	saved = _io_bytes(doc)
+	entries = []
+	with zipfile.ZipFile(saved) as package:
+		for info in package.infolist():
+			data = None if info.filename == doc.part.partname.membername else package.read(info)
+			entries.append((info, data))
+
+	style_ids = (center_style.style_id, doc.styles['name'].style_id)
+	tokens = [_TOKEN_RE.split(fragment) for fragment in (head, unit, last, tail)]
+	return _StreamSkeleton(entries, *tokens, style_ids, cells)
+
+
+def _io_bytes(doc):
+	"""Save a document into an in-memory buffer."""
+	buffer = io.BytesIO()
+	doc.save(buffer)
+	buffer.seek(0)
+	return buffer
+
+
+class ExportManifest:
+	"""
+	Remembers which input each generated file was written from.
+
+	Entries map an output path to the content hash of its inputs (see
+	`content_digest`) and the files that were written for it: usually just
+	that path, but e.g. the pages of a split schedule image. An output whose
+	hash is unchanged and whose files all still exist does not need to be
+	written again.
+	"""
+
+	def __init__(self, path=MANIFEST_PATH):
+		self.path = path
+		try:
+			with open(path, encoding="utf-8") as f:
+				self.entries = json.load(f)
+		except (OSError, ValueError):
+			self.entries = {}
+
+	def is_current(self, filepath, digest):
+		entry = self.entries.get(filepath)
+		if not isinstance(entry, dict) or entry.get("digest") != digest:
+			return False
+		return all(os.path.exists(path) for path in entry.get("files", ()))
+
+	def record(self, filepath, digest, files=None):
+		"""
+		:param files: the files actually written (default: just `filepath`)
+		"""
+		self.entries[filepath] = {"digest": digest, "files": list(files or [filepath])}
+
+	def forget(self, filepath):
+		self.entries.pop(filepath, None)
+
+	def save(self):
+		with _atomic_output(self.path) as f:
+			f.write(json.dumps(self.entries, indent=2, sort_keys=True).encode("utf-8"))
+
+
+def content_digest(*inputs):
+	"""
+	Hash the inputs of an export (JSON-serializable values) together with EXPORT_VERSION.
+
+	:return: str, hex digest
+	"""
+	payload = json.dumps([EXPORT_VERSION] + list(inputs), separators=(",", ":"))
+	return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def stage_digest(export, stage):
+	"""
+	Hash of everything an export stage's output depends on.
+
+	:param export: ScheduleExport
+	:param stage: name from EXPORT_STAGES
+	:return: str
+	"""
+	if stage == "Word":
+		return word_digest(export.matrix)
+	extra = {"Pie": export.activities, "Store": export.season, "Archive": export.season}.get(stage)
+	return content_digest(stage, export.name, export.matrix, extra)
+
+
+def word_digest(matrix, start=0, path=TEMPLATE_PATH):
+	"""
+	Hash of a Word file's groups and template.
+
+	A missing template hashes as None here; the Word writer reports it.
+
+	:param matrix: the file's groups
+	:param start: index of the file's first group (split exports)
+	:return: str
+	"""
+	try:
+		template = os.stat(path).st_mtime_ns
+	except OSError:
+		template = None
+	return content_digest("Word", start, matrix, template)
+
+
+def make_word_doc(matrix, file_name="Week 1", activities=None, season=""):
+	"""
+	creates the word document that contains the new schdule, along with the
+	JSON, CSV, chart and image exports (see `run_export_pipeline`).
 
 	:param matrix: 3d list
 	:param file_name: str
-	:return: None
+	:param activities: activity list used by the pie chart when nothing is assigned
+	:param season: season the week is stored under (see ScheduleExport)
+	:return: list of stage reports
 	"""
-	# enforce maximum periods per group
-	matrix = cap_periods(matrix)
+	report = run_export_pipeline(ScheduleExport(matrix, file_name, activities, season))
+	for stage in report:
+		# a split schedule image is several files, none of them at stage["path"]
+		files = ", ".join(stage["files"])
+		if stage["skipped"]:
+			print(f"- {stage['stage']} unchanged, kept: {files}")
+		elif stage["error"]:
+			print(f"✗ Error in {stage['stage']} export: {stage['error']}")
+		else:
+			print(f"✓ {stage['stage']} export successful: {files} ({stage['seconds']:.2f}s)")
+	return report
 
-	doc = docx.Document("2019 Template Schedules.docx")
-	style = doc.styles['Normal']
-	font = style.font
-	font.name = 'Arial'
-	font.size = Pt(12)
-	groups = len(matrix)
-	
-	# The template should already contain the header for Group 1; do not override it.
-	
-	create_tables(groups-1, doc)
+
+class ScheduleExport:
+	"""
+	Everything the exporters need about one schedule, built once.
+
+	- name: output file prefix and title, e.g. "Week 1"
+	- matrix: the schedule capped to MAX_PERIODS
+	- groups / periods / days: row and column labels
+	- activities: configured activity list (pie chart fallback)
+	- season: season or camp the week belongs to ("" if unused), part of its key in the store
+	- stats: shared ScheduleStats, computed on first use
+	"""
+
+	def __init__(self, matrix, name="Week 1", activities=None, season=""):
+		self.name = name
+		self.season = season
+		self.matrix = cap_periods(matrix)
+		self.activities = list(activities) if activities else []
+		num_periods = max((len(group) for group in self.matrix), default=0)
+		num_days = max((len(period) for group in self.matrix for period in group), default=0)
+		self.groups = [f"Group {g+1}" for g in range(len(self.matrix))]
+		self.periods = [f"Period {p+1}" for p in range(num_periods)]
+		self.days = DAYS[:num_days] + [f"Day {d+1}" for d in range(len(DAYS), num_days)]
+		self._stats = None
+
+	@property
+	def stats(self):
+		if self._stats is None:
+			from analysis import schedule_stats
+			self._stats = schedule_stats(self.matrix)
+		return self._stats
+
+	def path(self, stage):
+		"""Output path of an export stage (see EXPORT_STAGES)."""
+		return "Generated Schedules/" + EXPORT_STAGES[stage][0].format(self.name)
+
+
+# export stages: name -> (output file pattern, writer(export, path), runs in a separate process)
+EXPORT_STAGES = {
+	"Word": ("{} Schedules.docx", lambda export, path: write_word(export, path), False),
+	"JSON": ("{}_schedule.json", lambda export, path: write_json(export, path), False),
+	"CSV": ("{}_schedule.csv", lambda export, path: write_csv(export, path), False),
+	"Image": ("{}_schedule_pillow.png", lambda export, path: render_schedule_image(export, path), False),
+	"Chart": ("{}_visualization.png", lambda export, path: render_bar_chart(export, path), True),
+	"Pie": ("{}_pie.png", lambda export, path: render_pie_chart(export, path), True),
+	# every week goes into one SQLite store (see store.py)
+	"Store": ("schedules.db", lambda export, path: _store_export(export, path), False),
+	# and into the memory-mapped season archive used for long-range analytics
+	"Archive": ("season.sched", lambda export, path: _archive_export(export, path), False),
+}
+
+
+def _store_export(export, path):
+	from store import save_export
+	save_export(export, path)
+
+
+def _archive_export(export, path):
+	from store import archive_export
+	archive_export(export, path)
+
+
+def export_stage(export, stage, force=False):
+	"""
+	Write a single export format, unless it is unchanged (see `run_export_pipeline`).
+
+	:param export: ScheduleExport
+	:param stage: name from EXPORT_STAGES
+	:param force: write it even if unchanged
+	:return: list of the stage's files
+	"""
+	report = run_export_pipeline(export, [stage], force)[0]
+	if report["error"]:
+		raise RuntimeError(report["error"])
+	return report["files"]
+
+
+def _write_stage(export, stage):
+	"""Run a stage's writer, returning the files it wrote."""
+	path = export.path(stage)
+	os.makedirs(os.path.dirname(path), exist_ok=True)
+	files = EXPORT_STAGES[stage][1](export, path)
+	return list(files) if files else [path]
+
+
+def run_export_pipeline(export, stages=None, force=False):
+	"""
+	Run the independent export stages concurrently.
+
+	Every stage reads the same ScheduleExport. File writers run in a
+	thread pool; the Matplotlib charts are rendered in a process pool that
+	is started once and reused (see `_chart_pool`), so the total time is
+	close to that of the slowest stage. Stages whose
+	inputs hash the same as when their file was last written are skipped
+	unless `force` is set (see ExportManifest).
+
+	:param export: ScheduleExport
+	:param stages: names from EXPORT_STAGES to run (default: all)
+	:param force: regenerate every file even if unchanged
+	:return: list of {"stage", "path", "files", "seconds", "error", "skipped"} dicts, in
+		stage order; "files" are the files the stage wrote (or kept)
+	"""
 	os.makedirs("Generated Schedules", exist_ok=True)
-	doc.save("Generated Schedules/" + file_name + " Schedules.docx")
-	doc = docx.Document("Generated Schedules/" + file_name + " Schedules.docx")
-	fill_tables(matrix, doc)
-	doc.save("Generated Schedules/" + file_name + " Schedules.docx")
-    
-	# Generate additional outputs with new libraries
-	export_schedule_json(matrix, file_name)
-	export_schedule_csv(matrix, file_name)
-	create_schedule_visualization(matrix, file_name)
-	generate_schedule_image_pillow(matrix, file_name)
+	stages = list(stages or EXPORT_STAGES)
+	manifest = ExportManifest()
+	digests = {name: stage_digest(export, name) for name in stages}
+	pending = [name for name in stages if force or not manifest.is_current(export.path(name), digests[name])]
+
+	futures = {}
+	with ThreadPoolExecutor(max(1, len(pending))) as threads:
+		for name in pending:
+			pool = _chart_pool() if EXPORT_STAGES[name][2] else threads
+			futures[name] = pool.submit(_run_stage, export, name)
+
+		report = []
+		for name in stages:
+			path = export.path(name)
+			if name not in futures:
+				files = manifest.entries[path]["files"]
+				report.append({"stage": name, "path": path, "files": files, "seconds": 0.0, "error": None, "skipped": True})
+				continue
+			try:
+				seconds, error, files = futures[name].result()
+			except Exception as e:
+				# the worker process itself failed
+				seconds, error, files = 0.0, str(e), []
+				if isinstance(e, BrokenProcessPool):
+					_discard_chart_pool()
+			if error:
+				manifest.forget(path)
+			else:
+				manifest.record(path, digests[name], files)
+			report.append({"stage": name, "path": path, "files": files, "seconds": seconds, "error": error, "skipped": False})
+	manifest.save()
+	return report
+
+
+def _chart_pool():
+	"""
+	Return the process pool the chart stages run in, creating it on first use.
+
+	The pool is kept for the life of the process, so only the first export
+	pays for starting it. Its workers are spawned rather than forked: the
+	UI process runs threads, and a forked child can inherit a lock that one
+	of them was holding.
+
+	:return: ProcessPoolExecutor
+	"""
+	global _chart_executor
+	with _chart_executor_lock:
+		if _chart_executor is None:
+			chart_stages = sum(1 for stage in EXPORT_STAGES.values() if stage[2])
+			_chart_executor = ProcessPoolExecutor(chart_stages, mp_context=multiprocessing.get_context("spawn"))
+		return _chart_executor
+
+
+def _discard_chart_pool():
+	"""Drop a broken chart pool, so the next export starts a new one."""
+	global _chart_executor
+	with _chart_executor_lock:
+		if _chart_executor is not None:
+			_chart_executor.shutdown(wait=False)
+			_chart_executor = None
+
+
+def _run_stage(export, name):
+	"""Run one export stage, returning (seconds taken, error message or None, files written)."""
+	start = time.perf_counter()
+	files = []
+	try:
+		files = _write_stage(export, name)
+		error = None
+	except Exception as e:
+		error = str(e)
+	return time.perf_counter() - start, error, files
+
+
+def _export_and_report(matrix, file_name, stage, done, failed):
+	"""Write one format for the single-format helpers, printing the outcome."""
+	try:
+		files = export_stage(ScheduleExport(matrix, file_name), stage)
+		print(f"✓ {done}: {', '.join(files)}")
+	except Exception as e:
+		print(f"✗ {failed}: {e}")
+
+
+def write_word(export, filepath, workers=None, groups_per_file=None, manifest=None):
+	"""
+	Write the Word document (see `write_word_doc`).
+
+	:param export: ScheduleExport
+	:param filepath: str
+	:return: list of output file paths
+	"""
+	return write_word_doc(export.matrix, filepath, workers, groups_per_file, manifest)
+
+
+def write_json(export, filepath, mode="pretty", append=False):
+	"""
+	Write the schedule as JSON: Group -> Period -> days.
+
+	Modes:
+	- "pretty": one indented object {"Group 1": [[days], ...], ...}
+	- "compact": the same object without whitespace
+	- "ndjson": one line per group, {"week": ..., "group": ..., "periods": [[days], ...]}
+	- "ndjson-week": one line for the whole week, {"week": ..., "groups": {...}}
+
+	The compact and NDJSON modes are written group by group rather than
+	built in memory first. NDJSON output can be appended to an existing
+	file, e.g. to keep a whole season in one file (see `write_season_json`).
+
+	:param export: ScheduleExport
+	:param filepath: str
+	:param mode: one of JSON_MODES
+	:param append: add to the end of the file instead of replacing it (NDJSON modes only)
+	:return: None
+	"""
+	if mode not in JSON_MODES:
+		raise ValueError(f"Unknown JSON mode: {mode}")
+	if mode == "pretty" and not append:
+		schedule_dict = dict(zip(export.groups, export.matrix))
+		with open(filepath, 'w') as f:
+			json.dump(schedule_dict, f, indent=2)
+		return
+	if append and not mode.startswith("ndjson"):
+		raise ValueError("Only NDJSON output can be appended to")
+
+	if append:
+		with open(filepath, 'a', encoding="utf-8") as f:
+			f.writelines(_json_chunks(export, mode))
+	else:
+		with _atomic_output(filepath) as raw, io.TextIOWrapper(raw, encoding="utf-8") as f:
+			f.writelines(_json_chunks(export, mode))
+
+
+def write_season_json(exports, filepath, per_week=False, append=False):
+	"""
+	Write many schedules (e.g. every week of a season) to one NDJSON file.
+
+	Only one week is held as JSON text at a time.
+
+	:param exports: iterable of ScheduleExport
+	:param filepath: str
+	:param per_week: one line per week instead of one line per group
+	:param append: add to the end of an existing file
+	:return: None
+	"""
+	mode = "ndjson-week" if per_week else "ndjson"
+	with contextlib.ExitStack() as stack:
+		if append:
+			f = stack.enter_context(open(filepath, 'a', encoding="utf-8"))
+		else:
+			raw = stack.enter_context(_atomic_output(filepath))
+			f = stack.enter_context(io.TextIOWrapper(raw, encoding="utf-8"))
+		for export in exports:
+			f.writelines(_json_chunks(export, mode))
+
+
+def _json_chunks(export, mode):
+	"""Yield the JSON text of a schedule piece by piece (see `write_json` for the modes)."""
+	compact = {"separators": (",", ":")}
+	name = json.dumps(export.name)
+	if mode == "ndjson":
+		for label, group in zip(export.groups, export.matrix):
+			yield '{"week":' + name + ',"group":' + json.dumps(label) + ',"periods":' + json.dumps(group, **compact) + '}\n'
+		return
+
+	yield '{"week":' + name + ',"groups":{' if mode == "ndjson-week" else "{"
+	for g, (label, group) in enumerate(zip(export.groups, export.matrix)):
+		yield ("," if g else "") + json.dumps(label) + ":" + json.dumps(group, **compact)
+	yield "}}\n" if mode == "ndjson-week" else "}"
 
 
 def export_schedule_json(matrix, file_name):
@@ -127,19 +992,24 @@ def export_schedule_json(matrix, file_name):
 	:param file_name: str
 	:return: None
 	"""
-	try:
-		# cap periods to MAX_PERIODS before exporting
-		matrix = cap_periods(matrix)
-		schedule_dict = {}
-		for g, group in enumerate(matrix):
-			schedule_dict[f"Group {g+1}"] = group
-		
-		filepath = f"Generated Schedules/{file_name}_schedule.json"
-		with open(filepath, 'w') as f:
-			json.dump(schedule_dict, f, indent=2)
-		print(f"✓ JSON export successful: {filepath}")
-	except Exception as e:
-		print(f"✗ Error exporting JSON: {e}")
+	_export_and_report(matrix, file_name, "JSON", "JSON export successful", "Error exporting JSON")
+
+
+def write_csv(export, filepath):
+	"""
+	Write the schedule as CSV: one row per group and period, one column per day.
+
+	:param export: ScheduleExport
+	:param filepath: str
+	:return: None
+	"""
+	with open(filepath, 'w', newline='', encoding='utf-8') as f:
+		writer = csv.writer(f)
+		writer.writerow(["Group", "Period"] + export.days)
+
+		for group_label, group in zip(export.groups, export.matrix):
+			for period_label, period in zip(export.periods, group):
+				writer.writerow([group_label, period_label] + period)
 
 
 def export_schedule_csv(matrix, file_name):
@@ -150,21 +1020,18 @@ def export_schedule_csv(matrix, file_name):
 	:param file_name: str
 	:return: None
 	"""
-	try:
-		# cap periods to MAX_PERIODS before exporting
-		matrix = cap_periods(matrix)
-		filepath = f"Generated Schedules/{file_name}_schedule.csv"
-		with open(filepath, 'w', newline='', encoding='utf-8') as f:
-			writer = csv.writer(f)
-			writer.writerow(["Group", "Period", "Monday", "Tuesday", "Wednesday", "Thursday"])
-            
-			for g, group in enumerate(matrix):
-				for period_num, period in enumerate(group):
-					row = [f"Group {g+1}", f"Period {period_num+1}"] + period
-					writer.writerow(row)
-		print(f"✓ CSV export successful: {filepath}")
-	except Exception as e:
-		print(f"✗ Error exporting CSV: {e}")
+	_export_and_report(matrix, file_name, "CSV", "CSV export successful", "Error exporting CSV")
+
+
+def render_bar_chart(export, filepath):
+	"""
+	Draw the activity frequency bar chart.
+
+	:param export: ScheduleExport
+	:param filepath: str
+	:return: None
+	"""
+	chart_renderer().bar(export, filepath)
 
 
 def create_schedule_visualization(matrix, file_name):
@@ -175,36 +1042,239 @@ def create_schedule_visualization(matrix, file_name):
 	:param file_name: str
 	:return: None
 	"""
-	try:
-		# cap periods to MAX_PERIODS before visualizing
-		matrix = cap_periods(matrix)
-		# Count activities
-		activity_counts = {}
-		for group in matrix:
-			for period in group:
-				for activity in period:
-					if activity and activity != "":
-						activity_counts[activity] = activity_counts.get(activity, 0) + 1
-		
-		# Create visualization using matplotlib
-		plt.figure(figsize=(12, 6))
+	_export_and_report(matrix, file_name, "Chart", "Matplotlib visualization created", "Error creating visualization")
+
+
+def render_pie_chart(export, filepath):
+	"""
+	Draw the activity distribution pie chart.
+
+	If nothing is assigned yet, the export's configured activities are
+	plotted with equal shares, so a pie chart can be made from a blank template.
+
+	:param export: ScheduleExport
+	:param filepath: str
+	:return: None
+	"""
+	chart_renderer().pie(export, filepath)
+
+
+def render_charts(exports, workers=None):
+	"""
+	Draw the bar and pie charts of many schedules (e.g. every week and camp).
+
+	The charts are drawn concurrently in a thread pool; each worker thread
+	reuses its own ChartRenderer figures for all the charts it draws.
+
+	:param exports: list of ScheduleExport
+	:param workers: number of threads (default: CPU count)
+	:return: list of written file paths, in order (bar, pie per export)
+	"""
+	os.makedirs("Generated Schedules", exist_ok=True)
+	jobs = []
+	for export in exports:
+		jobs.append((render_bar_chart, export, export.path("Chart")))
+		jobs.append((render_pie_chart, export, export.path("Pie")))
+	with ThreadPoolExecutor(workers or os.cpu_count() or 1) as pool:
+		futures = [pool.submit(render, export, path) for render, export, path in jobs]
+		for future in futures:
+			future.result()
+	return [path for _, _, path in jobs]
+
+
+class ChartRenderer:
+	"""
+	Draws the bar and pie charts on reusable Matplotlib figures.
+
+	The figures are plain `Figure` objects on an Agg canvas, so nothing goes
+	through pyplot's global state and separate renderers can draw at the same
+	time. Each figure and its axes are created once and cleared between
+	charts. A renderer is not shared between threads: use `chart_renderer()`
+	to get the calling thread's one.
+	"""
+
+	def __init__(self):
+		self._axes = {}
+
+	def _blank_axes(self, kind, figsize):
+		"""Return the (cleared) axes of this renderer's figure of the given kind."""
+		ax = self._axes.get(kind)
+		if ax is None:
+			from matplotlib.figure import Figure
+			from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+			fig = Figure(figsize=figsize)
+			FigureCanvasAgg(fig)
+			ax = self._axes[kind] = fig.add_subplot()
+		else:
+			ax.clear()
+			# undo the previous chart's tight_layout, so every chart is laid out
+			# from the same starting point as on a new figure
+			from matplotlib import rcParams
+			ax.figure.subplots_adjust(**{
+				side: rcParams["figure.subplot." + side]
+				for side in ("left", "right", "bottom", "top", "wspace", "hspace")
+			})
+		return ax
+
+	def bar(self, export, filepath):
+		"""Draw the activity frequency bar chart (see `render_bar_chart`)."""
+		activity_counts = export.stats.activity_counts
+		ax = self._blank_axes("bar", (12, 6))
 		activities = list(activity_counts.keys())
 		counts = list(activity_counts.values())
-		
-		plt.bar(activities, counts, color='steelblue')
-		plt.xlabel('Activities')
-		plt.ylabel('Frequency')
-		plt.title(f'Schedule Activity Frequency - {file_name}')
-		plt.xticks(rotation=45, ha='right')
-		plt.tight_layout()
-		
-		# Save the figure
-		filepath = f"Generated Schedules/{file_name}_visualization.png"
-		plt.savefig(filepath, dpi=100)
-		plt.close()
-		print(f"✓ Matplotlib visualization created: {filepath}")
-	except Exception as e:
-		print(f"✗ Error creating visualization: {e}")
+
+		ax.bar(activities, counts, color='steelblue')
+		ax.set_xlabel('Activities')
+		ax.set_ylabel('Frequency')
+		ax.set_title(f'Schedule Activity Frequency - {export.name}')
+		for label in ax.get_xticklabels():
+			label.set(rotation=45, ha='right')
+		ax.figure.tight_layout()
+		ax.figure.savefig(filepath, dpi=100)
+
+	def pie(self, export, filepath):
+		"""Draw the activity distribution pie chart (see `render_pie_chart`)."""
+		from matplotlib import colormaps
+
+		activity_counts = export.stats.activity_counts
+		if not activity_counts:
+			if not export.activities:
+				raise ValueError("No activity data to plot")
+			activity_counts = {a: 1 for a in export.activities}
+
+		labels = list(activity_counts.keys())
+		sizes = list(activity_counts.values())
+		cmap = colormaps['tab20']
+		colors = [cmap(i % 20) for i in range(len(labels))]
+
+		ax = self._blank_axes("pie", (8, 8))
+		explode = [0.04] * len(labels)
+		wedges, texts, autotexts = ax.pie(
+			sizes,
+			labels=labels,
+			autopct='%1.1f%%',
+			startangle=140,
+			colors=colors,
+			explode=explode,
+			pctdistance=0.77,
+			wedgeprops={'edgecolor': 'white', 'linewidth': 0.7}
+		)
+		ax.axis('equal')
+		for autotext in autotexts:
+			autotext.set(size=10, weight='bold', color='white')
+		ax.set_title(f'Activity Distribution - {export.name}')
+		ax.figure.tight_layout()
+		ax.figure.savefig(filepath, dpi=150)
+
+
+def chart_renderer():
+	"""
+	Return the calling thread's ChartRenderer, creating it on first use.
+
+	:return: ChartRenderer
+	"""
+	renderer = getattr(_chart_renderers, "renderer", None)
+	if renderer is None:
+		renderer = _chart_renderers.renderer = ChartRenderer()
+	return renderer
+
+
+def render_schedule_image(export, filepath, groups_per_page=IMAGE_GROUPS_PER_PAGE):
+	"""
+	Draw the schedule as a period x day grid per group with Pillow.
+
+	Every activity gets its own cell color. Cells are pasted from cached,
+	pre-rendered label tiles (see `_label_tile`), so drawing a schedule is
+	mostly image copies. Schedules with more than `groups_per_page` groups
+	are split over several images named "<name> (Groups 1-10).png", ...
+
+	:param export: ScheduleExport
+	:param filepath: str
+	:param groups_per_page: int
+	:return: list of written file paths
+	"""
+	from PIL import Image
+
+	colors = {name: IMAGE_PALETTE[i % len(IMAGE_PALETTE)] for i, name in enumerate(export.stats.names)}
+	days = len(export.days)
+	width = 2 * _IMAGE_MARGIN + _IMAGE_LABEL_WIDTH + days * _IMAGE_CELL_WIDTH
+	group_height = _IMAGE_HEADING_HEIGHT + (len(export.periods) + 1) * _IMAGE_CELL_HEIGHT + _IMAGE_MARGIN
+
+	base, ext = os.path.splitext(filepath)
+	paths = []
+	for start in range(0, max(len(export.matrix), 1), groups_per_page):
+		groups = export.matrix[start:start + groups_per_page]
+		height = 2 * _IMAGE_MARGIN + _IMAGE_HEADING_HEIGHT + len(groups) * group_height
+		img = Image.new('RGB', (width, height), color='white')
+		img.paste(_label_tile(f"Schedule - {export.name}", width - 2 * _IMAGE_MARGIN, _IMAGE_HEADING_HEIGHT, "white", 20, False), (_IMAGE_MARGIN, _IMAGE_MARGIN))
+
+		y = _IMAGE_MARGIN + _IMAGE_HEADING_HEIGHT
+		for g, group in enumerate(groups, start):
+			img.paste(_label_tile(export.groups[g], width - 2 * _IMAGE_MARGIN, _IMAGE_HEADING_HEIGHT, "white", 16, False), (_IMAGE_MARGIN, y))
+			y += _IMAGE_HEADING_HEIGHT
+			x = _IMAGE_MARGIN + _IMAGE_LABEL_WIDTH
+			for day in export.days:
+				img.paste(_label_tile(day, _IMAGE_CELL_WIDTH, _IMAGE_CELL_HEIGHT, _IMAGE_HEADER_FILL), (x, y))
+				x += _IMAGE_CELL_WIDTH
+			y += _IMAGE_CELL_HEIGHT
+			for period_label, period in zip(export.periods, group):
+				img.paste(_label_tile(period_label, _IMAGE_LABEL_WIDTH, _IMAGE_CELL_HEIGHT, _IMAGE_HEADER_FILL), (_IMAGE_MARGIN, y))
+				x = _IMAGE_MARGIN + _IMAGE_LABEL_WIDTH
+				for activity in period:
+					img.paste(_label_tile(activity, _IMAGE_CELL_WIDTH, _IMAGE_CELL_HEIGHT, colors.get(activity, "white")), (x, y))
+					x += _IMAGE_CELL_WIDTH
+				y += _IMAGE_CELL_HEIGHT
+			y += _IMAGE_MARGIN
+
+		if len(export.matrix) <= groups_per_page:
+			page_path = filepath
+		else:
+			page_path = f"{base} (Groups {start + 1}-{start + len(groups)}){ext}"
+		img.save(page_path)
+		paths.append(page_path)
+	return paths
+
+
+@functools.lru_cache(maxsize=None)
+def _image_font(size):
+	"""Load the schedule image font once per size (Pillow's built-in font if no TrueType font is found)."""
+	from PIL import ImageFont
+
+	for name in ("DejaVuSans.ttf", "arial.ttf", "Arial.ttf"):
+		try:
+			return ImageFont.truetype(name, size)
+		except OSError:
+			continue
+	return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=1024)
+def _label_tile(text, width, height, fill, size=14, border=True):
+	"""
+	Render one grid cell: a filled, outlined box with its text centered.
+
+	Text that does not fit is shortened with an ellipsis. Tiles are cached
+	and only read by the callers (pasted), so they can be shared between
+	threads.
+
+	:return: PIL Image
+	"""
+	from PIL import Image, ImageDraw
+
+	tile = Image.new('RGB', (width, height), color=fill)
+	draw = ImageDraw.Draw(tile)
+	if border:
+		draw.rectangle((0, 0, width - 1, height - 1), outline=_IMAGE_GRID_COLOR)
+	font = _image_font(size)
+	label = text
+	while label and draw.textlength(label, font=font) > width - 8:
+		label = label[:-2] + "…" if len(label) > 1 else ""
+	if border:
+		draw.text((width / 2, height / 2), label, fill='black', font=font, anchor="mm")
+	else:
+		draw.text((0, height / 2), label, fill='black', font=font, anchor="lm")
+	return tile
 
 
 def generate_schedule_image_pillow(matrix, file_name):
@@ -215,64 +1285,184 @@ def generate_schedule_image_pillow(matrix, file_name):
 	:param file_name: str
 	:return: None
 	"""
-	try:
-		# cap periods to MAX_PERIODS before generating image
-		matrix = cap_periods(matrix)
-		# Create image
-		img_width = 1400
-		img_height = 200 + (len(matrix) * 180)
-		img = Image.new('RGB', (img_width, img_height), color='white')
-		draw = ImageDraw.Draw(img)
-		
-		# Add title
-		draw.text((50, 20), f"Schedule - {file_name}", fill='black')
-		
-		# Add schedule data
-		y_offset = 80
-		for g, group in enumerate(matrix):
-			draw.text((50, y_offset), f"Group {g+1}:", fill='darkblue')
-			y_offset += 35
-			
-			for period_num, period in enumerate(group):
-				period_text = f"Period {period_num+1}: {' | '.join(period)}"
-				draw.text((70, y_offset), period_text, fill='black')
-				y_offset += 25
-			
-			y_offset += 25
-		
-		# Save image
-		filepath = f"Generated Schedules/{file_name}_schedule_pillow.png"
-		img.save(filepath)
-		print(f"✓ Pillow image generated: {filepath}")
-	except Exception as e:
-		print(f"✗ Error generating image: {e}")
+	_export_and_report(matrix, file_name, "Image", "Pillow image generated", "Error generating image")
 
 
-def make_word_doc_only(matrix, file_name="Week 1"):
+def make_word_doc_only(matrix, file_name="Week 1", workers=None, groups_per_file=None, force=True):
 	"""
 	Create and save only the Word document for the schedule (no JSON/CSV/images).
 
 	:param matrix: 3d list
 	:param file_name: str
+	:param workers: render groups in a pool of this many processes (see `write_word_doc_parallel`)
+	:param groups_per_file: split the output into documents of this many groups
+	:param force: when False, split files whose groups are unchanged are kept as they are
 	:return: None
 	"""
 	try:
-		matrix = cap_periods(matrix)
-		doc = docx.Document("2019 Template Schedules.docx")
-		style = doc.styles['Normal']
-		font = style.font
-		font.name = 'Arial'
-		font.size = Pt(12)
-		groups = len(matrix)
-
-		create_tables(groups-1, doc)
-		os.makedirs("Generated Schedules", exist_ok=True)
-		doc.save("Generated Schedules/" + file_name + " Schedules.docx")
-		doc = docx.Document("Generated Schedules/" + file_name + " Schedules.docx")
-		fill_tables(matrix, doc)
-		doc.save("Generated Schedules/" + file_name + " Schedules.docx")
-		print(f"✓ Word export successful: Generated Schedules/{file_name} Schedules.docx")
+		export = ScheduleExport(matrix, file_name)
+		filepath = export.path("Word")
+		os.makedirs(os.path.dirname(filepath), exist_ok=True)
+		manifest = None if force else ExportManifest()
+		for filepath in write_word(export, filepath, workers, groups_per_file, manifest):
+			print(f"✓ Word export successful: {filepath}")
+		if manifest is not None:
+			manifest.save()
 	except Exception as e:
 		print(f"✗ Error exporting Word-only document: {e}")
 
 
+def load_schedule(filepath, periods=None, days=None):
+	"""
+	Read a schedule back from an exported .json, .csv or .docx file.
+
+	:param filepath: str
+	:param periods: expected periods per group (checked when given)
+	:param days: expected days per period (checked when given)
+	:return: 3d list (group -> period -> day), as used by the solver
+	"""
+	ext = os.path.splitext(filepath)[1].lower()
+	if ext not in SCHEDULE_READERS:
+		raise ValueError(f"Can't load schedules from {ext or 'files without an extension'}: {filepath}")
+	matrix = SCHEDULE_READERS[ext](filepath, periods, days)
+	check_schedule_shape(matrix, periods, days, filepath)
+	return matrix
+
+
+def load_schedules(filepaths, periods=None, days=None, workers=None, encode=False):
+	"""
+	Read many exported schedules (e.g. a whole season) concurrently.
+
+	:param filepaths: list of str
+	:param periods: expected periods per group
+	:param days: expected days per period
+	:param workers: number of reader threads (default: CPU count)
+	:param encode: return `analysis.encode_schedules` codes instead of lists
+	:return: list of 3d lists in file order, or (codes, names) when encode is set
+	"""
+	with ThreadPoolExecutor(workers or os.cpu_count() or 1) as pool:
+		matrices = list(pool.map(lambda path: load_schedule(path, periods, days), filepaths))
+	if encode:
+		from analysis import encode_schedules
+		return encode_schedules(matrices)
+	return matrices
+
+
+def check_schedule_shape(matrix, periods=None, days=None, source="schedule"):
+	"""
+	Check that every group has `periods` periods of `days` activity names.
+
+	:raise ValueError: naming the first group/period that does not fit
+	:return: None
+	"""
+	if not matrix:
+		raise ValueError(f"{source}: no groups found")
+	for g, group in enumerate(matrix):
+		if periods is not None and len(group) != periods:
+			raise ValueError(f"{source}: Group {g+1} has {len(group)} periods, expected {periods}")
+		for p, period in enumerate(group):
+			if days is not None and len(period) != days:
+				raise ValueError(f"{source}: Group {g+1} period {p+1} has {len(period)} days, expected {days}")
+			if not all(isinstance(activity, str) for activity in period):
+				raise ValueError(f"{source}: Group {g+1} period {p+1} has a value that is not an activity name")
+
+
+def read_json_schedule(filepath, periods=None, days=None):
+	"""
+	Read a schedule written by `write_json` in the "pretty" or "compact" mode.
+
+	:return: 3d list
+	"""
+	with open(filepath, encoding="utf-8") as f:
+		data = json.load(f)
+	if not isinstance(data, dict) or not all(isinstance(group, list) for group in data.values()):
+		raise ValueError(f"{filepath}: expected an object of Group -> Period -> days")
+	return list(data.values())
+
+
+def read_season_json(filepath):
+	"""
+	Read an NDJSON file written by `write_json`/`write_season_json`.
+
+	Lines of both NDJSON modes (one group or one week per line) may be
+	mixed; groups are kept in file order within each week.
+
+	:param filepath: str
+	:return: dict of week name -> 3d list, in file order
+	"""
+	weeks = {}
+	with open(filepath, encoding="utf-8") as f:
+		for line in f:
+			if not line.strip():
+				continue
+			record = json.loads(line)
+			week = weeks.setdefault(record["week"], [])
+			if "groups" in record:
+				week.extend(record["groups"].values())
+			else:
+				week.append(record["periods"])
+	return weeks
+
+
+def read_csv_schedule(filepath, periods=None, days=None):
+	"""
+	Read a schedule written by `write_csv`: Group, Period, then one column per day.
+
+	:return: 3d list
+	"""
+	groups = {}
+	with open(filepath, newline='', encoding='utf-8') as f:
+		reader = csv.reader(f)
+		header = next(reader, None)
+		if not header or header[:2] != ["Group", "Period"]:
+			raise ValueError(f"{filepath}: expected a Group, Period, days... header")
+		for row in reader:
+			if row:
+				groups.setdefault(row[0], []).append(row[2:])
+	return list(groups.values())
+
+
+def read_word_schedule(filepath, periods=None, days=None, template=TEMPLATE_PATH):
+	"""
+	Read the group tables of a Word schedule made by `write_word_doc`.
+
+	The document XML is parsed directly (no python-docx objects). Cells are
+	looked up with the template's fillable-cell map, so only the template
+	rows that take activities are read; pass `periods` to drop unused rows.
+
+	:param filepath: str
+	:param template: the template the document was made from
+	:return: 3d list
+	"""
+	from lxml import etree
+
+	cell_map = template_cell_map(template)
+	if periods is not None:
+		cell_map = cell_map[:periods]
+	if days is not None:
+		cell_map = [cells[:days] for cells in cell_map]
+
+	w = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+	with zipfile.ZipFile(filepath) as package:
+		body = etree.fromstring(package.read("word/document.xml")).find(w + "body")
+
+	matrix = []
+	for tbl in body.iterfind(w + "tbl"):
+		rows = tbl.findall(w + "tr")
+		group = []
+		for cells in cell_map:
+			period = []
+			for r, c in cells:
+				tc = rows[r].findall(w + "tc")[c]
+				period.append("".join(t.text or "" for t in tc.iter(w + "t")))
+			group.append(period)
+		matrix.append(group)
+	return matrix
+
+
+# readers for `load_schedule`, by file extension
+SCHEDULE_READERS = {
+	".json": read_json_schedule,
+	".csv": read_csv_schedule,
+	".docx": read_word_schedule,
+}